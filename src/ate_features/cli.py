@@ -236,7 +236,9 @@ def _load_weights() -> dict[str, float]:
 def score_collect(
     treatment_id: str,
     langgraph_dir: str = "data/langgraph",
-    mode: str = typer.Option("isolated", help="Scoring mode: isolated or cumulative"),
+    mode: str = typer.Option(
+        "isolated", help="Scoring mode: isolated, cumulative, or combined"
+    ),
 ) -> None:
     """Collect scores by applying patches and running acceptance tests."""
     from pathlib import Path
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import copy
+import functools
 from pathlib import Path
 
 import yaml
@@ -22,7 +24,15 @@ DEFAULT_CONFIG_DIR = Path(__file__).parent.parent.parent / "config"
 
 
 def load_features(config_dir: Path = DEFAULT_CONFIG_DIR) -> FeaturePortfolio:
-    """Load feature portfolio from features.yaml."""
+    """Load feature portfolio from features.yaml.
+
+    Parsed once per config_dir; each call returns its own deep copy.
+    """
+    return _load_features(config_dir).model_copy(deep=True)
+
+
+@functools.cache
+def _load_features(config_dir: Path) -> FeaturePortfolio:
     features_path = config_dir / "features.yaml"
     if not features_path.exists():
         msg = f"features.yaml not found at {features_path}"
@@ -41,7 +51,15 @@ def load_features(config_dir: Path = DEFAULT_CONFIG_DIR) -> FeaturePortfolio:
 
 
 def load_treatments(config_dir: Path = DEFAULT_CONFIG_DIR) -> TreatmentConfig:
-    """Load treatment configuration from treatments.yaml."""
+    """Load treatment configuration from treatments.yaml.
+
+    Parsed once per config_dir; each call returns its own deep copy.
+    """
+    return _load_treatments(config_dir).model_copy(deep=True)
+
+
+@functools.cache
+def _load_treatments(config_dir: Path) -> TreatmentConfig:
     treatments_path = config_dir / "treatments.yaml"
     if not treatments_path.exists():
         msg = f"treatments.yaml not found at {treatments_path}"
@@ -120,7 +138,15 @@ def load_scoring_config(
 def load_execution_config(
     config_dir: Path = DEFAULT_CONFIG_DIR,
 ) -> dict[str, object]:
-    """Load execution parameters (escape threshold, transcript path) from YAML."""
+    """Load execution parameters (escape threshold, transcript path) from YAML.
+
+    Parsed once per config_dir; each call returns its own deep copy.
+    """
+    return copy.deepcopy(_load_execution_config(config_dir))
+
+
+@functools.cache
+def _load_execution_config(config_dir: Path) -> dict[str, object]:
     exec_path = config_dir / "execution.yaml"
     if not exec_path.exists():
         msg = f"execution.yaml not found at {exec_path}"
@@ -128,6 +154,11 @@ def load_execution_config(
 
     with open(exec_path) as f:
         result: dict[str, object] = yaml.safe_load(f)
+
+    # Coerce numeric fields once here so callers can use them as-is
+    escape = result.get("escape_threshold_minutes")
+    if isinstance(escape, str | float):
+        result["escape_threshold_minutes"] = int(escape)
     return result
 
 
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import io
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from ate_features.config import (
@@ -20,6 +23,111 @@ from ate_features.models import (
     Treatment,
 )
 
+# --- Constant runbook fragments (formatted once per runbook) ---
+
+_PRE_SESSION_TMPL = (
+    "## 1. Pre-Session Setup\n\n"
+    "Run these commands from the ate-features repo root.\n\n"
+    "### 1.1 Run preflight checks\n\n"
+    "```bash\n"
+    "ate-features exec preflight\n"
+    "```\n\n"
+    "- [ ] Preflight passed (LangGraph at correct pin, clean working tree)\n"
+    "- [ ] CC version recorded: `___________`\n\n"
+    "### 1.2 Scaffold session directories\n\n"
+    "```bash\n"
+    "ate-features exec scaffold {tid}\n"
+    "```\n\n"
+    "- [ ] `data/transcripts/treatment-{tid}/` created\n"
+    "- [ ] `session_guide.md`, `metadata.json`, `notes.md` present\n\n"
+    "### 1.3 Create patches directory\n\n"
+    "```bash\n"
+    "mkdir -p data/patches/treatment-{tid}\n"
+    "```\n\n"
+    "- [ ] `data/patches/treatment-{tid}/` exists\n\n"
+    "### 1.4 Verify LangGraph is clean\n\n"
+    "```bash\n"
+    "git -C data/langgraph status\n"
+    "git -C data/langgraph diff --stat\n"
+    "```\n\n"
+    "- [ ] Working tree clean (no modifications, no untracked files)\n\n"
+    "### 1.5 Record session start\n\n"
+    "```bash\n"
+    "date -u +\"%Y-%m-%dT%H:%M:%SZ\"\n"
+    "```\n\n"
+    "- [ ] Start time: `___________`\n\n"
+    "---\n\n"
+)
+
+_PER_FEATURE_TMPL = (
+    "### 2.{fid} — {title}\n\n"
+    "Launch Claude Code:\n\n"
+    "```bash\n"
+    "cd data/langgraph\n"
+    "{cmd}\n"
+    "```\n\n"
+    "{confirm}\n\n"
+    "Paste the following prompt:\n\n"
+    "````\n"
+    "{prompt}\n"
+    "````\n\n"
+    "- [ ] Pasted opening prompt\n"
+    "- [ ] Agent began working on {fid}\n\n"
+    "---\n\n"
+)
+
+_POST_SESSION_HEAD = (
+    "## 4. After-Session Steps\n\n"
+    "### 4.1 Record end timestamp\n\n"
+    "```bash\n"
+    "date -u +\"%Y-%m-%dT%H:%M:%SZ\"\n"
+    "```\n\n"
+    "- [ ] End time: `___________`\n\n"
+    "### 4.2 Check for unsaved work\n\n"
+    "```bash\n"
+    "git -C data/langgraph diff --stat\n"
+    "```\n\n"
+)
+
+_METADATA_TMPL = (
+    "### 4.5 Update metadata.json\n\n"
+    "Update `data/transcripts/treatment-{tid}/metadata.json` with "
+    "actual timing and outcome data:\n\n"
+    "```json\n"
+    "{{\n"
+    "  \"started_at\": \"2026-XX-XXTXX:XX:XXZ\",\n"
+    "  \"completed_at\": \"2026-XX-XXTXX:XX:XXZ\",\n"
+    "  \"wall_clock_seconds\": null,\n"
+    "  \"session_id\": null,\n"
+    "  \"model\": \"claude-opus-4-6\",\n"
+    "  \"notes\": null\n"
+    "}}\n"
+    "```\n\n"
+    "- [ ] metadata.json updated\n\n"
+)
+
+_TRANSCRIPT_TMPL = (
+    "### 4.7 Save session transcript\n\n"
+    "Claude Code stores session transcripts as JSONL files at:\n\n"
+    "```\n"
+    "{transcript_hint}\n"
+    "```\n\n"
+    "Look for the most recent `.jsonl` file matching the session time.\n\n"
+    "- [ ] Session transcript located or session ID noted: `___________`\n\n"
+    "---\n\n"
+)
+
+_CHECKLIST_TAIL = (
+    "- [ ] LangGraph is clean after final feature\n"
+    "- [ ] Per-feature timing recorded in monitoring table\n"
+    "- [ ] metadata.json updated with actual data\n"
+    "- [ ] Notes written with observations\n"
+    "- [ ] Session transcript saved\n"
+    "- [ ] Total wall-clock time: `___________`\n"
+    "\n"
+    "---\n\n"
+)
+
 
 def _shell_command(treatment: Treatment) -> str:
     """Return the shell command to start Claude Code for this treatment."""
@@ -289,10 +397,15 @@ def generate_runbook(
     specialization_context: str | None = None,
     communication_nudge: str | None = None,
     scoring_mode: str = "isolated",
+    exec_config: dict[str, object] | None = None,
 ) -> str:
-    """Generate a complete markdown runbook for a treatment."""
-    exec_config = load_execution_config()
-    escape_minutes = int(str(exec_config.get("escape_threshold_minutes", 45)))
+    """Generate a complete markdown runbook for a treatment.
+
+    Pass exec_config to reuse an already-loaded execution.yaml.
+    """
+    if exec_config is None:
+        exec_config = load_execution_config()
+    escape_minutes = exec_config.get("escape_threshold_minutes", 45)
     transcript_hint = str(
         exec_config.get("transcript_path_hint", "~/.claude/projects/")
     )
@@ -300,94 +413,47 @@ def generate_runbook(
     tid = treatment.id
     at = uses_agent_teams(treatment)
     per_feature = is_per_feature_treatment(treatment)
-    sections: list[str] = []
+    cmd = _shell_command(treatment)
+    buf = io.StringIO()
+
+    def emit(text: str) -> None:
+        buf.write(text)
+        buf.write("\n")
 
     # --- Header ---
-    sections.append(f"# Runbook: Treatment {tid} — {treatment.label}\n")
-    sections.append(f"**Treatment**: {tid} ({treatment.label})")
-    sections.append(
+    emit(f"# Runbook: Treatment {tid} — {treatment.label}\n")
+    emit(f"**Treatment**: {tid} ({treatment.label})")
+    emit(
         f"**Description**: {_treatment_description(treatment)}"
     )
-    sections.append("**Expected Duration**: 2-6 hours")
-    sections.append(f"**Agent Teams**: "
-                    f"{'ON' if at else 'OFF'}"
-                    f"{' (`' + _shell_command(treatment) + '`)' if at else ''}")
-    sections.append("")
-    sections.append(_dimensions_table(treatment))
-    sections.append("\n---\n")
+    emit("**Expected Duration**: 2-6 hours")
+    emit(f"**Agent Teams**: "
+         f"{'ON' if at else 'OFF'}"
+         f"{' (`' + cmd + '`)' if at else ''}")
+    emit("")
+    emit(_dimensions_table(treatment))
+    emit("\n---\n")
 
     # --- §1 Pre-Session Setup ---
-    sections.append("## 1. Pre-Session Setup\n")
-    sections.append("Run these commands from the ate-features repo root.\n")
-
-    sections.append("### 1.1 Run preflight checks\n")
-    sections.append("```bash")
-    sections.append("ate-features exec preflight")
-    sections.append("```\n")
-    sections.append("- [ ] Preflight passed (LangGraph at correct pin, "
-                    "clean working tree)")
-    sections.append("- [ ] CC version recorded: `___________`\n")
-
-    sections.append("### 1.2 Scaffold session directories\n")
-    sections.append("```bash")
-    sections.append(f"ate-features exec scaffold {tid}")
-    sections.append("```\n")
-    sections.append(f"- [ ] `data/transcripts/treatment-{tid}/` created")
-    sections.append("- [ ] `session_guide.md`, `metadata.json`, "
-                    "`notes.md` present\n")
-
-    sections.append("### 1.3 Create patches directory\n")
-    sections.append("```bash")
-    sections.append(f"mkdir -p data/patches/treatment-{tid}")
-    sections.append("```\n")
-    sections.append(f"- [ ] `data/patches/treatment-{tid}/` exists\n")
-
-    sections.append("### 1.4 Verify LangGraph is clean\n")
-    sections.append("```bash")
-    sections.append("git -C data/langgraph status")
-    sections.append("git -C data/langgraph diff --stat")
-    sections.append("```\n")
-    sections.append("- [ ] Working tree clean (no modifications, "
-                    "no untracked files)\n")
-
-    sections.append("### 1.5 Record session start\n")
-    sections.append("```bash")
-    sections.append("date -u +\"%Y-%m-%dT%H:%M:%SZ\"")
-    sections.append("```\n")
-    sections.append("- [ ] Start time: `___________`\n")
-
-    sections.append("---\n")
+    buf.write(_PRE_SESSION_TMPL.format(tid=tid))
 
     # --- §2 Opening Prompt ---
-    sections.append("## 2. Opening Prompt\n")
+    emit("## 2. Opening Prompt\n")
 
     if per_feature:
-        sections.append(
+        emit(
             "This is a per-feature treatment — run 8 separate sessions, "
             "one per feature. See the sub-sections below.\n"
         )
-        sections.append("---\n")
-        for feat in features:
-            sections.append(
-                f"### 2.{feat.id} — {feat.title}\n"
+        emit("---\n")
+        if at:
+            confirm = f"- [ ] Confirmed: launched with `{cmd}`"
+        else:
+            confirm = (
+                "- [ ] Confirmed: launched with plain `claude` "
+                "(no Agent Teams env var)"
             )
-            sections.append("Launch Claude Code:\n")
-            sections.append("```bash")
-            sections.append("cd data/langgraph")
-            sections.append(_shell_command(treatment))
-            sections.append("```\n")
-
-            if at:
-                sections.append(
-                    f"- [ ] Confirmed: launched with "
-                    f"`{_shell_command(treatment)}`\n"
-                )
-            else:
-                sections.append(
-                    "- [ ] Confirmed: launched with plain `claude` "
-                    "(no Agent Teams env var)\n"
-                )
-
+        for feat in features:
             prompt = get_opening_prompt(
                 treatment,
                 [feat],
@@ -396,37 +462,36 @@ def generate_runbook(
                 communication_nudge=communication_nudge,
                 scoring_mode=scoring_mode,
             )
-            sections.append("Paste the following prompt:\n")
-            sections.append("````")
-            sections.append(prompt)
-            sections.append("````\n")
-            sections.append("- [ ] Pasted opening prompt")
-            sections.append(f"- [ ] Agent began working on {feat.id}\n")
-            sections.append("---\n")
+            buf.write(
+                _PER_FEATURE_TMPL.format(
+                    fid=feat.id,
+                    title=feat.title,
+                    cmd=cmd,
+                    confirm=confirm,
+                    prompt=prompt,
+                )
+            )
     else:
-        sections.append("Launch Claude Code:\n")
-        sections.append("```bash")
-        sections.append("cd data/langgraph")
-        sections.append(_shell_command(treatment))
-        sections.append("```\n")
+        emit("Launch Claude Code:\n")
+        emit("```bash")
+        emit("cd data/langgraph")
+        emit(cmd)
+        emit("```\n")
 
         if at:
-            sections.append(
-                f"- [ ] Confirmed: launched with "
-                f"`{_shell_command(treatment)}`\n"
-            )
+            emit(f"- [ ] Confirmed: launched with `{cmd}`\n")
         else:
-            sections.append(
+            emit(
                 "- [ ] Confirmed: launched with plain `claude` "
                 "(NOT `CLAUDE_CODE_EXPERIMENTAL_AGENT_TEAMS=1 claude`)\n"
             )
 
-        sections.append("### 2.1 Paste the opening prompt\n")
-        sections.append(
+        emit("### 2.1 Paste the opening prompt\n")
+        emit(
             "Copy and paste the **entire block below** as a single "
             "message:\n"
         )
-        sections.append("---\n")
+        emit("---\n")
 
         prompt = get_opening_prompt(
             treatment,
@@ -436,184 +501,135 @@ def generate_runbook(
             communication_nudge=communication_nudge,
             scoring_mode=scoring_mode,
         )
-        sections.append("````")
-        sections.append(prompt)
-        sections.append("````\n")
-        sections.append("---\n")
-        sections.append("- [ ] Pasted the full opening prompt")
-        sections.append("- [ ] Agent acknowledged the features and began "
-                        "working\n")
+        emit("````")
+        emit(prompt)
+        emit("````\n")
+        emit("---\n")
+        emit("- [ ] Pasted the full opening prompt")
+        emit("- [ ] Agent acknowledged the features and began "
+             "working\n")
 
-    sections.append("---\n")
+    emit("---\n")
 
     # --- §3 Monitoring ---
-    sections.append("## 3. Monitoring Guidelines\n")
+    emit("## 3. Monitoring Guidelines\n")
 
-    sections.append("### 3.1 Cadence\n")
-    sections.append(
+    emit("### 3.1 Cadence\n")
+    emit(
         "Glance at the session every **2-3 minutes**. You do not need to "
         "watch continuously, but check progress regularly to catch "
         "stalls early.\n"
     )
 
-    sections.append("### 3.2 What to watch for\n")
-    sections.append(_signal_action_table(treatment, scoring_mode))
-    sections.append("")
+    emit("### 3.2 What to watch for\n")
+    emit(_signal_action_table(treatment, scoring_mode))
+    emit("")
 
-    sections.append("### 3.3 Escape time thresholds\n")
-    sections.append(
+    emit("### 3.3 Escape time thresholds\n")
+    emit(
         f"Wall-clock time limit per feature: **~{escape_minutes} minutes**. "
         "If the agent has not produced a patch (or acknowledged it cannot) "
         "within the threshold, intervene.\n"
     )
 
-    sections.append(_nudge_templates(treatment, scoring_mode))
+    emit(_nudge_templates(treatment, scoring_mode))
 
     if not per_feature:
-        sections.append("### 3.5 Per-feature tracking\n")
-        sections.append(
+        emit("### 3.5 Per-feature tracking\n")
+        emit(
             "Use this table to track progress in real time "
             "(fill in as you go):\n"
         )
-        sections.append(_per_feature_tracking_table(features))
-        sections.append("")
+        emit(_per_feature_tracking_table(features))
+        emit("")
 
-    sections.append("\n---\n")
+    emit("\n---\n")
 
     # --- §4 After-Session Steps ---
-    sections.append("## 4. After-Session Steps\n")
-
-    sections.append("### 4.1 Record end timestamp\n")
-    sections.append("```bash")
-    sections.append("date -u +\"%Y-%m-%dT%H:%M:%SZ\"")
-    sections.append("```\n")
-    sections.append("- [ ] End time: `___________`\n")
-
-    sections.append("### 4.2 Check for unsaved work\n")
-    sections.append("```bash")
-    sections.append("git -C data/langgraph diff --stat")
-    sections.append("```\n")
+    buf.write(_POST_SESSION_HEAD)
 
     if scoring_mode == "cumulative":
-        sections.append(
+        emit(
             "If the agent did not save the final combined patch, "
             "save it now:\n"
         )
-        sections.append("```bash")
-        sections.append(
+        emit("```bash")
+        emit(
             f"git -C data/langgraph diff > "
             f"data/patches/treatment-{tid}/cumulative.patch"
         )
-        sections.append("```\n")
+        emit("```\n")
     else:
-        sections.append(
+        emit(
             "If there are uncommitted changes, save them as a "
             "remaining patch:\n"
         )
-        sections.append("```bash")
-        sections.append(
+        emit("```bash")
+        emit(
             f"git -C data/langgraph diff > "
             f"data/patches/treatment-{tid}/remaining.patch"
         )
-        sections.append("git -C data/langgraph checkout . && "
-                        "git -C data/langgraph clean -fd")
-        sections.append("```\n")
+        emit("git -C data/langgraph checkout . && "
+             "git -C data/langgraph clean -fd")
+        emit("```\n")
 
-    sections.append("### 4.3 Verify patches\n")
-    sections.append("```bash")
-    sections.append(f"ate-features exec verify-patches {tid}")
-    sections.append(f"ls -la data/patches/treatment-{tid}/")
-    sections.append("```\n")
+    emit("### 4.3 Verify patches\n")
+    emit("```bash")
+    emit(f"ate-features exec verify-patches {tid}")
+    emit(f"ls -la data/patches/treatment-{tid}/")
+    emit("```\n")
 
     if scoring_mode == "cumulative":
-        sections.append(
+        emit(
             "Expected: `cumulative.patch` (combined result) plus "
             "per-feature snapshots (`F1.patch` through `F8.patch`).\n"
         )
     else:
-        sections.append(
+        emit(
             "Expected: up to 8 files (`F1.patch` through `F8.patch`). "
             "Some may be empty (0 bytes) if the agent could not implement "
             "that feature.\n"
         )
-    sections.append("- [ ] Verified patch files present")
-    sections.append("- [ ] Non-empty patches: `___________`\n")
+    emit("- [ ] Verified patch files present")
+    emit("- [ ] Non-empty patches: `___________`\n")
 
-    sections.append("### 4.4 Verify LangGraph is clean\n")
-    sections.append("```bash")
+    emit("### 4.4 Verify LangGraph is clean\n")
+    emit("```bash")
     if scoring_mode == "cumulative":
-        sections.append("git -C data/langgraph checkout . && "
-                        "git -C data/langgraph clean -fd")
-    sections.append("git -C data/langgraph status")
-    sections.append("```\n")
-    sections.append("- [ ] Working tree clean\n")
-
-    sections.append("### 4.5 Update metadata.json\n")
-    sections.append(
-        f"Update `data/transcripts/treatment-{tid}/metadata.json` with "
-        "actual timing and outcome data:\n"
-    )
-    sections.append("```json")
-    sections.append("{")
-    sections.append("  \"started_at\": \"2026-XX-XXTXX:XX:XXZ\",")
-    sections.append("  \"completed_at\": \"2026-XX-XXTXX:XX:XXZ\",")
-    sections.append("  \"wall_clock_seconds\": null,")
-    sections.append("  \"session_id\": null,")
-    sections.append("  \"model\": \"claude-opus-4-6\",")
-    sections.append("  \"notes\": null")
-    sections.append("}")
-    sections.append("```\n")
-    sections.append("- [ ] metadata.json updated\n")
-
-    sections.append(_notes_template(treatment))
-
-    sections.append("### 4.7 Save session transcript\n")
-    sections.append(
-        "Claude Code stores session transcripts as JSONL files at:\n"
-    )
-    sections.append("```")
-    sections.append(transcript_hint)
-    sections.append("```\n")
-    sections.append(
-        "Look for the most recent `.jsonl` file matching the session time.\n"
-    )
-    sections.append(
-        "- [ ] Session transcript located or session ID noted: "
-        "`___________`\n"
-    )
+        emit("git -C data/langgraph checkout . && "
+             "git -C data/langgraph clean -fd")
+    emit("git -C data/langgraph status")
+    emit("```\n")
+    emit("- [ ] Working tree clean\n")
+
+    buf.write(_METADATA_TMPL.format(tid=tid))
 
-    sections.append("---\n")
+    emit(_notes_template(treatment))
+
+    buf.write(_TRANSCRIPT_TMPL.format(transcript_hint=transcript_hint))
 
     # --- §5 Final Checklist ---
-    sections.append("## 5. Final Checklist\n")
+    emit("## 5. Final Checklist\n")
     at_check = (
         "Agent Teams env var was set"
         if at else "No Agent Teams env var was set (plain `claude`)"
     )
-    sections.append(f"- [ ] {at_check}")
-    sections.append("- [ ] All 8 features were attempted")
+    emit(f"- [ ] {at_check}")
+    emit("- [ ] All 8 features were attempted")
     if scoring_mode == "cumulative":
-        sections.append("- [ ] Per-feature snapshots saved")
-        sections.append("- [ ] cumulative.patch saved (combined result)")
+        emit("- [ ] Per-feature snapshots saved")
+        emit("- [ ] cumulative.patch saved (combined result)")
     else:
-        sections.append(
+        emit(
             "- [ ] Patches saved for each feature (even if empty)"
         )
-        sections.append("- [ ] LangGraph was reset between features")
-    sections.append("- [ ] LangGraph is clean after final feature")
-    sections.append("- [ ] Per-feature timing recorded in monitoring table")
-    sections.append("- [ ] metadata.json updated with actual data")
-    sections.append("- [ ] Notes written with observations")
-    sections.append("- [ ] Session transcript saved")
-    sections.append("- [ ] Total wall-clock time: `___________`")
-    sections.append("")
-
-    sections.append("---\n")
+        emit("- [ ] LangGraph was reset between features")
+    buf.write(_CHECKLIST_TAIL)
 
     # --- Appendix ---
-    sections.append(_feature_quick_reference(features))
+    buf.write(_feature_quick_reference(features))
 
-    return "\n".join(sections)
+    return buf.getvalue()
 
 
 def generate_all_runbooks(
@@ -623,6 +639,7 @@ def generate_all_runbooks(
     config = load_treatments()
     features = load_features().features
     assignments = config.feature_assignments.explicit
+    exec_config = load_execution_config()
 
     runbooks: dict[int | str, str] = {}
     for treatment in config.treatments:
@@ -631,19 +648,32 @@ def generate_all_runbooks(
             features,
             assignments=assignments,
             scoring_mode=scoring_mode,
+            exec_config=exec_config,
         )
     return runbooks
 
 
 def save_runbooks(
-    runbooks: dict[int | str, str],
+    runbooks: Mapping[int | str, str | bytes],
     output_dir: Path,
 ) -> list[Path]:
-    """Save runbooks to files in output_dir."""
+    """Save runbooks to files in output_dir.
+
+    Content is written as UTF-8 bytes regardless of locale; already-encoded
+    runbooks are written as-is. Files are written concurrently; the returned
+    paths follow the mapping's order.
+    """
     output_dir.mkdir(parents=True, exist_ok=True)
-    paths: list[Path] = []
-    for tid, content in runbooks.items():
-        path = output_dir / f"treatment-{tid}.md"
-        path.write_text(content)
-        paths.append(path)
+    paths = [output_dir / f"treatment-{tid}.md" for tid in runbooks]
+    if not paths:
+        return paths
+
+    def write(path: Path, content: str | bytes) -> None:
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+        path.write_bytes(content)
+
+    with ThreadPoolExecutor(max_workers=min(8, len(paths))) as pool:
+        # Consume the iterator so write errors propagate
+        list(pool.map(write, paths, runbooks.values()))
     return paths
@@ -4,21 +4,31 @@ from __future__ import annotations
 
 import glob
 import json
-import math
+import os
 import re
+import statistics
 import subprocess
+import sys
 import xml.etree.ElementTree as ET
+from collections.abc import Iterator
 from pathlib import Path
 
+from pydantic import TypeAdapter
+
 from ate_features.models import TieredScore
 
-# Tier class name patterns in acceptance tests
-_TIER_PATTERNS: dict[str, str] = {
-    "t1": "TestT1",
-    "t2": "TestT2",
-    "t3": "TestT3",
-    "t4": "TestT4",
-}
+try:  # Optional accelerator for writing score files (see _dump_json)
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment, unused-ignore]
+
+# Tier class names in acceptance tests are TestT<digit>... (TestT1Basic, etc.)
+_TIER_MARKER = "TestT"
+# Child elements marking a testcase as not passed
+_NOT_PASSED_TAGS = frozenset({"failure", "error", "skipped"})
+
+# Tier digit → index into the fixed-size [t1, t2, t3, t4] count lists
+_TIER_INDEX: dict[str, int] = {"1": 0, "2": 1, "3": 2, "4": 3}
 
 
 def parse_junit_xml(
@@ -29,46 +39,66 @@ def parse_junit_xml(
     """Parse a JUnit XML report into a TieredScore.
 
     Identifies tiers by test class name patterns (TestT1Basic, TestT2EdgeCases, etc.).
-    Tests with <failure> or <error> elements count as failed.
+    Tests with <failure>, <error> or <skipped> elements count as not passed.
     """
-    tree = ET.parse(xml_path)  # noqa: S314
-    root = tree.getroot()
-
-    tier_totals: dict[str, int] = {"t1": 0, "t2": 0, "t3": 0, "t4": 0}
-    tier_passed: dict[str, int] = {"t1": 0, "t2": 0, "t3": 0, "t4": 0}
+    tier_totals = [0, 0, 0, 0]
+    tier_passed = [0, 0, 0, 0]
 
-    for testcase in root.iter("testcase"):
-        classname = testcase.get("classname", "")
+    for classname, passed in _iter_testcases(xml_path):
         tier = _classify_tier(classname)
         if tier is None:
             continue
 
         tier_totals[tier] += 1
-        has_failure = testcase.find("failure") is not None
-        has_error = testcase.find("error") is not None
-        if not has_failure and not has_error:
+        if passed:
             tier_passed[tier] += 1
 
+    return _build_score(feature_id, treatment_id, tier_totals, tier_passed)
+
+
+def _build_score(
+    feature_id: str,
+    treatment_id: int | str,
+    tier_totals: list[int],
+    tier_passed: list[int],
+) -> TieredScore:
+    """Build a TieredScore from [t1, t2, t3, t4] total/passed count lists."""
     return TieredScore(
         feature_id=feature_id,
         treatment_id=treatment_id,
-        t1_passed=tier_passed["t1"],
-        t1_total=tier_totals["t1"],
-        t2_passed=tier_passed["t2"],
-        t2_total=tier_totals["t2"],
-        t3_passed=tier_passed["t3"],
-        t3_total=tier_totals["t3"],
-        t4_passed=tier_passed["t4"],
-        t4_total=tier_totals["t4"],
+        t1_passed=tier_passed[0],
+        t1_total=tier_totals[0],
+        t2_passed=tier_passed[1],
+        t2_total=tier_totals[1],
+        t3_passed=tier_passed[2],
+        t3_total=tier_totals[2],
+        t4_passed=tier_passed[3],
+        t4_total=tier_totals[3],
     )
 
 
-def _classify_tier(classname: str) -> str | None:
-    """Map a test class name to a tier key (t1-t4) or None."""
-    for tier, pattern in _TIER_PATTERNS.items():
-        if pattern in classname:
-            return tier
-    return None
+def _iter_testcases(xml_path: Path) -> Iterator[tuple[str, bool]]:
+    """Stream (classname, passed) pairs from a JUnit XML report.
+
+    Uses iterparse and clears each <testcase> once read, so the full tree
+    is never held in memory.
+    """
+    for _event, testcase in ET.iterparse(xml_path):  # noqa: S314
+        if testcase.tag != "testcase":
+            continue
+        # One pass over the children; passing tests usually have none
+        passed = not any(child.tag in _NOT_PASSED_TAGS for child in testcase)
+        yield testcase.get("classname", ""), passed
+        testcase.clear()
+
+
+def _classify_tier(classname: str) -> int | None:
+    """Map a test class name to a tier index (0-3 for t1-t4) or None."""
+    idx = classname.rfind(_TIER_MARKER)
+    if idx < 0:
+        return None
+    digit_at = idx + len(_TIER_MARKER)
+    return _TIER_INDEX.get(classname[digit_at:digit_at + 1])
 
 
 def _extract_feature_id(classname: str) -> str | None:
@@ -91,54 +121,65 @@ def parse_junit_xml_cumulative(
     Groups testcases by feature ID (extracted from classname),
     then computes per-feature TieredScores.
     """
-    tree = ET.parse(xml_path)  # noqa: S314
-    root = tree.getroot()
+    by_feature, _collection_error = _tally_by_feature(xml_path)
+    return [
+        _build_score(fid, treatment_id, *by_feature[fid])
+        for fid in sorted(by_feature.keys())
+    ]
+
+
+def _tally_by_feature(
+    xml_path: Path,
+) -> tuple[dict[str, tuple[list[int], list[int]]], bool]:
+    """Tally (tier_totals, tier_passed) per feature in one streaming pass.
 
-    # Group testcases by feature
-    by_feature: dict[str, list[ET.Element]] = {}
-    for testcase in root.iter("testcase"):
-        classname = testcase.get("classname", "")
+    Also reports whether any testcase has an empty classname, which is how
+    pytest records a module that failed to import.
+    """
+    by_feature: dict[str, tuple[list[int], list[int]]] = {}
+    collection_error = False
+    for classname, passed in _iter_testcases(xml_path):
+        if not classname:
+            collection_error = True
+            continue
         fid = _extract_feature_id(classname)
         if fid is None:
             continue
-        by_feature.setdefault(fid, []).append(testcase)
-
-    scores: list[TieredScore] = []
-    for fid in sorted(by_feature.keys()):
-        tier_totals: dict[str, int] = {"t1": 0, "t2": 0, "t3": 0, "t4": 0}
-        tier_passed: dict[str, int] = {"t1": 0, "t2": 0, "t3": 0, "t4": 0}
-
-        for testcase in by_feature[fid]:
-            classname = testcase.get("classname", "")
-            tier = _classify_tier(classname)
-            if tier is None:
-                continue
-            tier_totals[tier] += 1
-            has_failure = testcase.find("failure") is not None
-            has_error = testcase.find("error") is not None
-            if not has_failure and not has_error:
-                tier_passed[tier] += 1
-
-        scores.append(TieredScore(
-            feature_id=fid,
-            treatment_id=treatment_id,
-            t1_passed=tier_passed["t1"],
-            t1_total=tier_totals["t1"],
-            t2_passed=tier_passed["t2"],
-            t2_total=tier_totals["t2"],
-            t3_passed=tier_passed["t3"],
-            t3_total=tier_totals["t3"],
-            t4_passed=tier_passed["t4"],
-            t4_total=tier_totals["t4"],
-        ))
+        tier_totals, tier_passed = by_feature.setdefault(
+            fid, ([0, 0, 0, 0], [0, 0, 0, 0]),
+        )
+        tier = _classify_tier(classname)
+        if tier is None:
+            continue
+        tier_totals[tier] += 1
+        if passed:
+            tier_passed[tier] += 1
 
-    return scores
+    return by_feature, collection_error
 
 
 # --- Persistence ---
 
 _DEFAULT_DATA_DIR = Path(__file__).parent.parent.parent / "data"
 
+# Validates a whole score file (JSON bytes → list[TieredScore]) in pydantic-core
+_SCORES_ADAPTER = TypeAdapter(list[TieredScore])
+
+# Score files are named treatment-{id}.json
+_SCORE_FILE_PREFIX = "treatment-"
+_SCORE_FILE_SUFFIX = ".json"
+
+
+def _dump_json(data: object) -> bytes:
+    """Serialize score data as 2-space-indented JSON bytes.
+
+    Matches json.dumps(indent=2) for the ASCII strings and integers a score
+    file holds; floats (1e16, NaN) and non-ASCII text would differ.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
 
 def save_scores(
     scores: list[TieredScore],
@@ -146,12 +187,18 @@ def save_scores(
     *,
     data_dir: Path = _DEFAULT_DATA_DIR,
 ) -> Path:
-    """Persist a list of TieredScores to data/scores/treatment-{id}.json."""
+    """Persist a list of TieredScores to data/scores/treatment-{id}.json.
+
+    Leaves the file untouched when its content would not change.
+    """
     scores_dir = data_dir / "scores"
     scores_dir.mkdir(parents=True, exist_ok=True)
     path = scores_dir / f"treatment-{treatment_id}.json"
     data = [s.model_dump(mode="json") for s in scores]
-    path.write_text(json.dumps(data, indent=2))
+    payload = _dump_json(data)
+    if path.exists() and path.read_bytes() == payload:
+        return path
+    path.write_bytes(payload)
     return path
 
 
@@ -165,8 +212,7 @@ def load_scores(
     if not path.exists():
         msg = f"No scores found for treatment {treatment_id} at {path}"
         raise FileNotFoundError(msg)
-    data = json.loads(path.read_text())
-    return [TieredScore(**entry) for entry in data]
+    return _SCORES_ADAPTER.validate_json(path.read_bytes())
 
 
 def load_all_scores(
@@ -181,13 +227,24 @@ def load_all_scores(
     if not scores_dir.exists():
         return {}
 
+    with os.scandir(scores_dir) as it:
+        entries = sorted(
+            (
+                e
+                for e in it
+                if e.name.startswith(_SCORE_FILE_PREFIX)
+                and e.name.endswith(_SCORE_FILE_SUFFIX)
+                and len(e.name) > len(_SCORE_FILE_PREFIX) + len(_SCORE_FILE_SUFFIX)
+                and e.is_file()
+            ),
+            key=lambda e: e.name,
+        )
+
     result: dict[str, list[TieredScore]] = {}
-    for path in sorted(scores_dir.glob("treatment-*.json")):
-        match = re.match(r"treatment-(.+)\.json$", path.name)
-        if match:
-            tid = match.group(1)
-            data = json.loads(path.read_text())
-            result[tid] = [TieredScore(**entry) for entry in data]
+    for entry in entries:
+        tid = entry.name[len(_SCORE_FILE_PREFIX) : -len(_SCORE_FILE_SUFFIX)]
+        with open(entry.path, "rb") as f:
+            result[tid] = _SCORES_ADAPTER.validate_json(f.read())
     return result
 
 
@@ -207,6 +264,8 @@ def collect_scores(
     Modes:
     - isolated: Apply each feature patch individually, run per-feature tests, revert.
     - cumulative: Apply cumulative.patch, run all tests once, extract per-feature.
+    - combined: Apply all feature patches together, run their tests once,
+      extract per-feature (see collect_scores_combined).
 
     Persists results to data/scores/treatment-{id}.json.
     """
@@ -215,6 +274,11 @@ def collect_scores(
             treatment_id, langgraph_dir,
             data_dir=data_dir, project_root=project_root,
         )
+    if mode == "combined":
+        return collect_scores_combined(
+            treatment_id, langgraph_dir,
+            data_dir=data_dir, project_root=project_root,
+        )
 
     patch_dir = data_dir / "patches" / f"treatment-{treatment_id}"
     if not patch_dir.exists():
@@ -238,52 +302,23 @@ def collect_scores(
         if not test_files:
             continue
 
-        # Apply patch (--check first)
-        check = subprocess.run(
-            ["git", "apply", "--check", str(patch_path)],
-            cwd=langgraph_dir,
-            capture_output=True,
-        )
-        if check.returncode != 0:
+        # A single patch applies atomically — on failure nothing is written
+        if _git(langgraph_dir, "apply", str(patch_path)).returncode != 0:
             continue
 
-        subprocess.run(
-            ["git", "apply", str(patch_path)],
-            cwd=langgraph_dir,
-            capture_output=True,
-        )
-
         try:
             # Run pytest from project root with absolute test paths
             xml_path = data_dir / "scores" / "tmp" / f"{feature_id}.xml"
             xml_path.parent.mkdir(parents=True, exist_ok=True)
 
-            subprocess.run(
-                [
-                    "pytest",
-                    *test_files,
-                    f"--junitxml={xml_path}",
-                    "-q",
-                ],
-                cwd=root,
-                capture_output=True,
-            )
+            _run_pytest(test_files, xml_path, root)
 
             if xml_path.exists():
                 score = parse_junit_xml(xml_path, feature_id, treatment_id)
                 scores.append(score)
         finally:
             # Always revert
-            subprocess.run(
-                ["git", "checkout", "."],
-                cwd=langgraph_dir,
-                capture_output=True,
-            )
-            subprocess.run(
-                ["git", "clean", "-fd"],
-                cwd=langgraph_dir,
-                capture_output=True,
-            )
+            _revert_patch(langgraph_dir, patch_path)
 
     if scores:
         save_scores(scores, treatment_id, data_dir=data_dir)
@@ -318,49 +353,109 @@ def collect_scores_cumulative(
     if not test_files:
         return []
 
-    # Apply cumulative patch (--check first)
-    check = subprocess.run(
-        ["git", "apply", "--check", str(cumulative_patch)],
-        cwd=langgraph_dir,
-        capture_output=True,
-    )
-    if check.returncode != 0:
+    # A single patch applies atomically — on failure nothing is written
+    if _git(langgraph_dir, "apply", str(cumulative_patch)).returncode != 0:
         return []
 
-    subprocess.run(
-        ["git", "apply", str(cumulative_patch)],
-        cwd=langgraph_dir,
-        capture_output=True,
-    )
-
     try:
         xml_path = data_dir / "scores" / "tmp" / "cumulative.xml"
         xml_path.parent.mkdir(parents=True, exist_ok=True)
 
-        subprocess.run(
-            [
-                "pytest",
-                *test_files,
-                f"--junitxml={xml_path}",
-                "-q",
-            ],
-            cwd=root,
-            capture_output=True,
-        )
+        _run_pytest(test_files, xml_path, root)
 
         scores: list[TieredScore] = []
         if xml_path.exists():
             scores = parse_junit_xml_cumulative(xml_path, treatment_id)
     finally:
-        subprocess.run(
-            ["git", "checkout", "."],
-            cwd=langgraph_dir,
-            capture_output=True,
+        _revert_patch(langgraph_dir, cumulative_patch)
+
+    if scores:
+        save_scores(scores, treatment_id, data_dir=data_dir)
+
+    return scores
+
+
+def collect_scores_combined(
+    treatment_id: int | str,
+    langgraph_dir: Path,
+    *,
+    data_dir: Path = _DEFAULT_DATA_DIR,
+    project_root: Path | None = None,
+) -> list[TieredScore]:
+    """Collect scores by applying all feature patches at once and running tests once.
+
+    1. Apply every F*.patch to langgraph_dir in one ``git apply``
+    2. Run the acceptance tests for those features with a single --junitxml
+    3. Parse combined XML into per-feature TieredScores
+    4. Revert langgraph_dir
+
+    Pays pytest startup once per treatment instead of once per feature, but
+    features are no longer measured in isolation: one patch can affect
+    another feature's tests. Falls back to isolated mode when a patch fails
+    to apply on top of the ones before it (e.g. two features edit the same
+    lines), or when a test module fails to import (pytest then aborts the
+    whole run, leaving every feature unscored).
+
+    Persists results to data/scores/treatment-{id}.json.
+    """
+    patch_dir = data_dir / "patches" / f"treatment-{treatment_id}"
+    if not patch_dir.exists():
+        return []
+
+    root = project_root or _DEFAULT_DATA_DIR.parent
+    test_dir = root / "tests" / "acceptance"
+
+    patch_paths: list[Path] = []
+    test_files: list[str] = []
+    for patch_path in sorted(patch_dir.glob("*.patch")):
+        feature_id = patch_path.stem
+        if not feature_id.upper().startswith("F"):
+            continue
+        pattern = str(test_dir / f"test_{feature_id.lower()}_*.py")
+        feature_tests = sorted(glob.glob(pattern))
+        if not feature_tests:
+            continue
+        patch_paths.append(patch_path)
+        test_files.extend(feature_tests)
+
+    if not patch_paths:
+        return []
+
+    # Patch files are applied one by one, so a conflict can leave earlier
+    # ones written (``git apply --check`` tests each against the clean tree
+    # and can't catch this); undo them, then score each patch on its own
+    if _git(langgraph_dir, "apply", *(str(p) for p in patch_paths)).returncode != 0:
+        _revert_patch(langgraph_dir, *patch_paths)
+        return collect_scores(
+            treatment_id, langgraph_dir,
+            data_dir=data_dir, project_root=project_root,
         )
-        subprocess.run(
-            ["git", "clean", "-fd"],
-            cwd=langgraph_dir,
-            capture_output=True,
+
+    collection_failed = False
+    try:
+        xml_path = data_dir / "scores" / "tmp" / "combined.xml"
+        xml_path.parent.mkdir(parents=True, exist_ok=True)
+
+        _run_pytest(test_files, xml_path, root)
+
+        scores: list[TieredScore] = []
+        if xml_path.exists():
+            by_feature, collection_failed = _tally_by_feature(xml_path)
+            if not collection_failed:
+                patched = {p.stem.upper() for p in patch_paths}
+                scores = [
+                    _build_score(fid, treatment_id, *by_feature[fid])
+                    for fid in sorted(by_feature.keys())
+                    if fid in patched
+                ]
+    finally:
+        _revert_patch(langgraph_dir, *patch_paths)
+
+    if collection_failed:
+        # Isolated runs confine the import failure to the feature that caused it
+        return collect_scores(
+            treatment_id, langgraph_dir,
+            data_dir=data_dir, project_root=project_root,
         )
 
     if scores:
@@ -369,6 +464,54 @@ def collect_scores_cumulative(
     return scores
 
 
+def _revert_patch(langgraph_dir: Path, *patch_paths: Path) -> None:
+    """Undo applied patches, touching only the files they changed.
+
+    Patches are reverse-applied in the opposite order to how they were
+    applied. Falls back to a full ``git checkout .`` + ``git clean -fd``
+    when the reverse apply fails (e.g. the tests left the patched files
+    modified).
+    """
+    reverse = _git(
+        langgraph_dir, "apply", "--reverse", *(str(p) for p in reversed(patch_paths))
+    )
+    if reverse.returncode == 0:
+        return
+
+    _git(langgraph_dir, "checkout", ".")
+    _git(langgraph_dir, "clean", "-fd")
+
+
+def _run_pytest(test_files: list[str], xml_path: Path, root: Path) -> None:
+    """Run acceptance tests from root, writing a JUnit XML report to xml_path.
+
+    Uses the current interpreter and skips the cache provider and ini addopts,
+    which only add startup cost to a one-shot scoring run.
+    """
+    subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "pytest",
+            *test_files,
+            f"--junitxml={xml_path}",
+            "-q",
+            "--no-header",
+            "-p",
+            "no:cacheprovider",
+            "-o",
+            "addopts=",
+        ],
+        cwd=root,
+        capture_output=True,
+    )
+
+
+def _git(repo_dir: Path, *args: str) -> subprocess.CompletedProcess[bytes]:
+    """Run a git command in repo_dir, capturing its output."""
+    return subprocess.run(["git", *args], cwd=repo_dir, capture_output=True)
+
+
 # --- Aggregation ---
 
 
@@ -399,7 +542,7 @@ def summarize_treatment(
     return {
         "treatment_id": str(scores[0].treatment_id),
         "n_features": len(scores),
-        "mean_composite": sum(composites) / len(composites),
+        "mean_composite": statistics.fmean(composites),
         "min_composite": min(composites),
         "max_composite": max(composites),
         "per_feature": per_feature,
@@ -440,15 +583,14 @@ def evaluate_wave2(
         float(s["mean_composite"]) for s in summaries.values()  # type: ignore[arg-type]
     ]
 
-    grand_mean = sum(means) / len(means)
+    grand_mean = statistics.fmean(means)
     if grand_mean == 0.0:
         return False, (
             f"All treatments scored 0.0 — no variance to analyze. "
             f"CV threshold: {cv_threshold:.2f}."
         )
 
-    variance = sum((m - grand_mean) ** 2 for m in means) / len(means)
-    std = math.sqrt(variance)
+    std = statistics.pstdev(means, mu=grand_mean)
     cv = std / grand_mean
 
     recommend = cv > cv_threshold
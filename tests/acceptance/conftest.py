@@ -2,13 +2,47 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, Any
+
 import pytest
 
+if TYPE_CHECKING:
+    from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Mark every T4 smoke test slow; they compile and run full graphs."""
+    for item in items:
+        cls = getattr(item, "cls", None)
+        if cls is not None and cls.__name__ == "TestT4Smoke":
+            item.add_marker(pytest.mark.slow)
 
-@pytest.fixture(autouse=True)
+
+@pytest.fixture(scope="session", autouse=True)
 def _check_langgraph_available() -> None:  # type: ignore[misc]
-    """Skip acceptance tests if LangGraph is not installed."""
+    """Skip acceptance tests if LangGraph is not installed.
+
+    Session-scoped so it runs before the module-scoped graph fixtures.
+    """
     try:
         import langgraph  # noqa: F401
     except ImportError:
         pytest.skip("LangGraph not installed. Run 'make setup-langgraph' first.")
+
+
+@pytest.fixture(scope="session")
+def serde() -> JsonPlusSerializer:
+    """One serializer shared by every acceptance module that requests it.
+
+    An import error here is a broken patch, not a missing install, so it is
+    left to error each requesting test rather than skip it.
+    """
+    from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+    return JsonPlusSerializer()
+
+
+@pytest.fixture
+def checkpoint_config(request: pytest.FixtureRequest) -> dict[str, Any]:
+    """Per-test thread config, so tests sharing a checkpointer never share state."""
+    return {"configurable": {"thread_id": request.node.nodeid}}
@@ -4,9 +4,20 @@ Currently StrEnum values may be downcast to plain strings during serialization.
 The EXT_CONSTRUCTOR mechanism should preserve the enum type through round-trips.
 """
 
-from enum import StrEnum
+import dataclasses
+import operator
+from collections.abc import Iterator
+from enum import Enum, StrEnum
+from typing import TYPE_CHECKING, Annotated, Any
 
+import pytest
 from pydantic import BaseModel
+from typing_extensions import TypedDict
+
+if TYPE_CHECKING:
+    from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+    from langgraph.graph import StateGraph
+    from langgraph.graph.state import CompiledStateGraph
 
 
 class Color(StrEnum):
@@ -29,38 +40,42 @@ class Size(StrEnum):
     LARGE = "large"
 
 
+def _values_at(obj: Any, path: tuple[Any, ...]) -> Iterator[Any]:
+    """Yield the value at path; a ``...`` step fans out over every list element."""
+    if not path:
+        yield obj
+        return
+    step, rest = path[0], path[1:]
+    for item in obj if step is ... else (obj[step],):
+        yield from _values_at(item, rest)
+
+
+def _assert_types_at(
+    result: dict[str, Any], expected_types: list[tuple[tuple[Any, ...], type]]
+) -> None:
+    """isinstance() at each path; like all(), vacuously true over an empty list."""
+    for path, expected_type in expected_types:
+        for value in _values_at(result, path):
+            assert isinstance(value, expected_type), f"result{list(path)} = {value!r}"
+
+
 class TestT1Basic:
     """Basic functionality — any first-attempt solution should pass these."""
 
-    def test_strenum_round_trip(self) -> None:
+    def test_strenum_round_trip(self, serde: "JsonPlusSerializer") -> None:
         """StrEnum value survives serialize/deserialize."""
-        from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
-
-        serde = JsonPlusSerializer()
-        data = {"color": Color.RED}
-
-        serialized = serde.dumps(data)
-        result = serde.loads(serialized)
+        result = serde.loads(serde.dumps({"color": Color.RED}))
 
         assert result["color"] == Color.RED
 
-    def test_isinstance_preserved(self) -> None:
+    def test_isinstance_preserved(self, serde: "JsonPlusSerializer") -> None:
         """isinstance() check works after round-trip."""
-        from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
-
-        serde = JsonPlusSerializer()
-        data = {"color": Color.GREEN}
-
-        serialized = serde.dumps(data)
-        result = serde.loads(serialized)
+        result = serde.loads(serde.dumps({"color": Color.GREEN}))
 
         assert isinstance(result["color"], Color)
 
-    def test_name_and_value(self) -> None:
+    def test_name_and_value(self, serde: "JsonPlusSerializer") -> None:
         """.name and .value attributes work after round-trip."""
-        from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
-
-        serde = JsonPlusSerializer()
         data = {"color": Color.BLUE}
 
         serialized = serde.dumps(data)
@@ -73,43 +88,48 @@ class TestT1Basic:
 class TestT2EdgeCases:
     """Edge cases — a naive first attempt may miss these."""
 
-    def test_strenum_in_dict_value(self) -> None:
-        """StrEnum as a dict value round-trips."""
-        from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
-
-        serde = JsonPlusSerializer()
-        data = {"config": {"theme": Color.RED, "size": Size.LARGE}}
-
-        serialized = serde.dumps(data)
-        result = serde.loads(serialized)
-
-        assert isinstance(result["config"]["theme"], Color)
-        assert isinstance(result["config"]["size"], Size)
-
-    def test_strenum_in_list(self) -> None:
-        """StrEnum as a list element round-trips."""
-        from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
-
-        serde = JsonPlusSerializer()
-        data = {"colors": [Color.RED, Color.GREEN, Color.BLUE]}
-
-        serialized = serde.dumps(data)
-        result = serde.loads(serialized)
-
-        assert all(isinstance(c, Color) for c in result["colors"])
-
-    def test_strenum_in_dataclass(self) -> None:
+    @pytest.mark.parametrize(
+        ("data", "expected_types"),
+        [
+            # StrEnum as a dict value round-trips
+            pytest.param(
+                {"config": {"theme": Color.RED, "size": Size.LARGE}},
+                [(("config", "theme"), Color), (("config", "size"), Size)],
+                id="strenum_in_dict_value",
+            ),
+            # StrEnum as a list element round-trips
+            pytest.param(
+                {"colors": [Color.RED, Color.GREEN, Color.BLUE]},
+                [(("colors", ...), Color)],
+                id="strenum_in_list",
+            ),
+            # Multiple different StrEnum types in the same object
+            pytest.param(
+                {"color": Color.RED, "size": Size.LARGE},
+                [(("color",), Color), (("size",), Size)],
+                id="multiple_enum_types",
+            ),
+        ],
+    )
+    def test_container_round_trip(
+        self,
+        serde: "JsonPlusSerializer",
+        data: dict[str, Any],
+        expected_types: list[tuple[tuple[Any, ...], type]],
+    ) -> None:
+        """StrEnum types survive inside plain containers."""
+        result = serde.loads(serde.dumps(data))
+
+        _assert_types_at(result, expected_types)
+
+    def test_strenum_in_dataclass(self, serde: "JsonPlusSerializer") -> None:
         """StrEnum as a dataclass field round-trips."""
-        import dataclasses
-
-        from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
 
         @dataclasses.dataclass
         class Config:
             color: Color
             size: Size
 
-        serde = JsonPlusSerializer()
         data = {"cfg": Config(color=Color.RED, size=Size.SMALL)}
 
         serialized = serde.dumps(data)
@@ -118,16 +138,13 @@ class TestT2EdgeCases:
         assert isinstance(result["cfg"].color, Color)
         assert isinstance(result["cfg"].size, Size)
 
-    def test_strenum_in_pydantic_model(self) -> None:
+    def test_strenum_in_pydantic_model(self, serde: "JsonPlusSerializer") -> None:
         """StrEnum as a Pydantic field round-trips."""
 
         class Theme(BaseModel):
             primary: Color
             secondary: Color
 
-        from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
-
-        serde = JsonPlusSerializer()
         data = {"theme": Theme(primary=Color.RED, secondary=Color.BLUE)}
 
         serialized = serde.dumps(data)
@@ -136,28 +153,12 @@ class TestT2EdgeCases:
         assert isinstance(result["theme"].primary, Color)
         assert isinstance(result["theme"].secondary, Color)
 
-    def test_multiple_enum_types(self) -> None:
-        """Multiple different StrEnum types in the same object."""
-        from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
-
-        serde = JsonPlusSerializer()
-        data = {"color": Color.RED, "size": Size.LARGE}
-
-        serialized = serde.dumps(data)
-        result = serde.loads(serialized)
-
-        assert isinstance(result["color"], Color)
-        assert isinstance(result["size"], Size)
-
 
 class TestT3Quality:
     """Quality constraints — first approach probably fails these."""
 
-    def test_custom_method_preserved(self) -> None:
+    def test_custom_method_preserved(self, serde: "JsonPlusSerializer") -> None:
         """StrEnum subclass with custom methods is preserved."""
-        from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
-
-        serde = JsonPlusSerializer()
         data = {"color": ColorWithMethod.RED}
 
         serialized = serde.dumps(data)
@@ -166,11 +167,8 @@ class TestT3Quality:
         assert isinstance(result["color"], ColorWithMethod)
         assert result["color"].is_primary()
 
-    def test_no_false_positive_with_plain_string(self) -> None:
+    def test_no_false_positive_with_plain_string(self, serde: "JsonPlusSerializer") -> None:
         """StrEnum with value matching a plain string doesn't cause confusion."""
-        from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
-
-        serde = JsonPlusSerializer()
         data = {"enum_val": Color.RED, "plain_str": "red"}
 
         serialized = serde.dumps(data)
@@ -180,95 +178,106 @@ class TestT3Quality:
         assert type(result["plain_str"]) is str
         assert not isinstance(result["plain_str"], Color)
 
-    def test_backward_compat_regular_enum(self) -> None:
+    def test_backward_compat_regular_enum(self, serde: "JsonPlusSerializer") -> None:
         """Regular Enum (non-Str) still works after StrEnum changes."""
-        from enum import Enum
-
-        from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
 
         class Priority(Enum):
             LOW = 1
             HIGH = 2
 
-        serde = JsonPlusSerializer()
         data = {"p": Priority.HIGH}
 
         serialized = serde.dumps(data)
         result = serde.loads(serialized)
 
-        assert isinstance(result["p"], Priority)
-        assert result["p"] == Priority.HIGH
+        assert result["p"] is Priority.HIGH
 
 
-class TestT4Smoke:
-    """Smoke/integration tests — realistic multi-node workflows."""
+class CheckpointState(TypedDict):
+    log: Annotated[list[str], operator.add]
+    color: Color
 
-    def test_strenum_survives_graph_checkpoint(self) -> None:
-        """StrEnum value in state survives checkpoint round-trip."""
-        import operator
-        from typing import Annotated
 
-        from langgraph.checkpoint.memory import InMemorySaver
-        from langgraph.graph import StateGraph
-        from typing_extensions import TypedDict
+def _checkpoint_step_1(state: CheckpointState) -> dict:
+    return {"log": ["step_1"], "color": Color.GREEN}
 
-        class State(TypedDict):
-            log: Annotated[list[str], operator.add]
-            color: Color
 
-        def step_1(state: State) -> dict:
-            return {"log": ["step_1"], "color": Color.GREEN}
+def _checkpoint_step_2(state: CheckpointState) -> dict:
+    return {"log": ["step_2"]}
 
-        def step_2(state: State) -> dict:
-            return {"log": ["step_2"]}
 
-        graph = StateGraph(State)
-        graph.add_node("step_1", step_1)
-        graph.add_node("step_2", step_2)
-        graph.add_edge("step_1", "step_2")
-        graph.set_entry_point("step_1")
-        graph.set_finish_point("step_2")
+class ColorListState(TypedDict):
+    colors: Annotated[list[Color], operator.add]
+    count: int
 
-        memory = InMemorySaver()
-        compiled = graph.compile(checkpointer=memory)
-        config = {"configurable": {"thread_id": "f3-smoke"}}
 
-        result = compiled.invoke(
-            {"log": [], "color": Color.RED}, config=config
-        )
-        assert result["log"] == ["step_1", "step_2"]
-        assert isinstance(result["color"], Color)
-        assert result["color"] == Color.GREEN
+def _add_color(state: ColorListState) -> dict:
+    color = [Color.RED, Color.GREEN, Color.BLUE][state["count"]]
+    return {"colors": [color], "count": state["count"] + 1}
 
-        state = compiled.get_state(config)
-        assert isinstance(state.values["color"], Color)
 
-    def test_strenum_list_accumulates_in_graph(self) -> None:
-        """StrEnum values accumulate in list reducer across graph nodes."""
-        import operator
-        from typing import Annotated
+def _route_color(state: ColorListState) -> str:
+    from langgraph.graph import END
+
+    return END if state["count"] >= 3 else "add_color"
 
-        from langgraph.graph import END, StateGraph
-        from typing_extensions import TypedDict
 
-        class State(TypedDict):
-            colors: Annotated[list[Color], operator.add]
-            count: int
+def _build_checkpoint_graph() -> "StateGraph":
+    """Uncompiled step_1 -> step_2 topology; callers attach a checkpointer."""
+    from langgraph.graph import StateGraph
 
-        def add_color(state: State) -> dict:
-            color = [Color.RED, Color.GREEN, Color.BLUE][state["count"]]
-            return {"colors": [color], "count": state["count"] + 1}
+    graph = StateGraph(CheckpointState)
+    graph.add_node("step_1", _checkpoint_step_1)
+    graph.add_node("step_2", _checkpoint_step_2)
+    graph.add_edge("step_1", "step_2")
+    graph.set_entry_point("step_1")
+    graph.set_finish_point("step_2")
+    return graph
 
-        def route(state: State) -> str:
-            return END if state["count"] >= 3 else "add_color"
 
-        graph = StateGraph(State)
-        graph.add_node("add_color", add_color)
-        graph.add_conditional_edges("add_color", route)
-        graph.set_entry_point("add_color")
-        compiled = graph.compile()
+@pytest.fixture(scope="module")
+def checkpoint_graph() -> "CompiledStateGraph":
+    """Two-node graph with an in-memory checkpointer, compiled once."""
+    from langgraph.checkpoint.memory import InMemorySaver
 
-        result = compiled.invoke({"colors": [], "count": 0})
+    return _build_checkpoint_graph().compile(checkpointer=InMemorySaver())
+
+
+@pytest.fixture(scope="module")
+def color_list_graph() -> "CompiledStateGraph":
+    """Looping graph that appends one Color per step, compiled once."""
+    from langgraph.graph import StateGraph
+
+    graph = StateGraph(ColorListState)
+    graph.add_node("add_color", _add_color)
+    graph.add_conditional_edges("add_color", _route_color)
+    graph.set_entry_point("add_color")
+    return graph.compile()
+
+
+class TestT4Smoke:
+    """Smoke/integration tests — realistic multi-node workflows."""
+
+    def test_strenum_survives_graph_checkpoint(
+        self,
+        checkpoint_graph: "CompiledStateGraph",
+        checkpoint_config: dict[str, Any],
+    ) -> None:
+        """StrEnum value in state survives checkpoint round-trip."""
+        result = checkpoint_graph.invoke(
+            {"log": [], "color": Color.RED}, config=checkpoint_config
+        )
+        assert result["log"] == ["step_1", "step_2"]
+        assert result["color"] is Color.GREEN
+
+        state = checkpoint_graph.get_state(checkpoint_config)
+        assert isinstance(state.values["color"], Color)
+
+    def test_strenum_list_accumulates_in_graph(
+        self, color_list_graph: "CompiledStateGraph"
+    ) -> None:
+        """StrEnum values accumulate in list reducer across graph nodes."""
+        result = color_list_graph.invoke({"colors": [], "count": 0})
         assert len(result["colors"]) == 3
-        assert all(isinstance(c, Color) for c in result["colors"])
+        assert {type(c) for c in result["colors"]} == {Color}
         assert result["colors"] == [Color.RED, Color.GREEN, Color.BLUE]
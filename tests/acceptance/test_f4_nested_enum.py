@@ -5,9 +5,19 @@ Top-level Enum values round-trip correctly, but when nested inside containers
 """
 
 import dataclasses
+import operator
+from collections.abc import Iterator, Sequence
 from enum import Enum, IntEnum
+from typing import TYPE_CHECKING, Annotated, Any
 
 import pytest
+from pydantic import BaseModel
+from typing_extensions import TypedDict
+
+if TYPE_CHECKING:
+    from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+    from langgraph.graph import StateGraph
+    from langgraph.graph.state import CompiledStateGraph
 
 
 class Status(Enum):
@@ -21,53 +31,137 @@ class Priority(IntEnum):
     HIGH = 3
 
 
-class TestT1Basic:
-    """Basic functionality — any first-attempt solution should pass these."""
+# Payload for test_performance_large_list; a tuple so no test can mutate it
+_ALTERNATING_STATUSES = (Status.ACTIVE, Status.INACTIVE) * 500
 
-    def test_enum_in_dict(self) -> None:
-        """Enum nested inside a dict round-trips correctly."""
-        from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
 
-        serde = JsonPlusSerializer()
-        data = {"config": {"status": Status.ACTIVE}}
+def _leading_types_are(values: Sequence[Any], *expected: type) -> bool:
+    """True if the first len(expected) items have exactly the expected types."""
+    return tuple(map(type, values[: len(expected)])) == expected
 
-        serialized = serde.dumps(data)
-        result = serde.loads(serialized)
-
-        assert isinstance(result["config"]["status"], Status)
-        assert result["config"]["status"] == Status.ACTIVE
 
-    def test_enum_in_list(self) -> None:
-        """Enum nested inside a list round-trips correctly."""
-        from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+def _values_at(obj: Any, path: tuple[Any, ...]) -> Iterator[Any]:
+    """Yield the value at path; a ``...`` step fans out over every list element."""
+    if not path:
+        yield obj
+        return
+    step, rest = path[0], path[1:]
+    for item in obj if step is ... else (obj[step],):
+        yield from _values_at(item, rest)
 
-        serde = JsonPlusSerializer()
-        data = {"statuses": [Status.ACTIVE, Status.INACTIVE]}
 
-        serialized = serde.dumps(data)
-        result = serde.loads(serialized)
+def _assert_types_at(
+    result: dict[str, Any], expected_types: list[tuple[tuple[Any, ...], type]]
+) -> None:
+    """isinstance() at each path; like all(), vacuously true over an empty list."""
+    for path, expected_type in expected_types:
+        for value in _values_at(result, path):
+            assert isinstance(value, expected_type), f"result{list(path)} = {value!r}"
 
-        assert all(isinstance(s, Status) for s in result["statuses"])
 
-    def test_top_level_still_works(self) -> None:
-        """Top-level enum round-trip still works (regression check)."""
-        from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
-
-        serde = JsonPlusSerializer()
-        data = {"status": Status.ACTIVE}
-
-        serialized = serde.dumps(data)
-        result = serde.loads(serialized)
+class TestT1Basic:
+    """Basic functionality — any first-attempt solution should pass these."""
 
-        assert isinstance(result["status"], Status)
+    def test_enum_in_dict(self, serde: "JsonPlusSerializer") -> None:
+        """Enum nested inside a dict round-trips correctly."""
+        result = serde.loads(serde.dumps({"config": {"status": Status.ACTIVE}}))
+
+        assert result["config"]["status"] is Status.ACTIVE
+
+    @pytest.mark.parametrize(
+        ("data", "expected_types"),
+        [
+            # Enum nested inside a list round-trips correctly
+            pytest.param(
+                {"statuses": [Status.ACTIVE, Status.INACTIVE]},
+                [(("statuses", ...), Status)],
+                id="enum_in_list",
+            ),
+            # Top-level enum round-trip still works (regression check)
+            pytest.param(
+                {"status": Status.ACTIVE},
+                [(("status",), Status)],
+                id="top_level_still_works",
+            ),
+        ],
+    )
+    def test_round_trip(
+        self,
+        serde: "JsonPlusSerializer",
+        data: dict[str, Any],
+        expected_types: list[tuple[tuple[Any, ...], type]],
+    ) -> None:
+        """Enums round-trip at the top level and one container deep."""
+        result = serde.loads(serde.dumps(data))
+
+        _assert_types_at(result, expected_types)
 
 
 class TestT2EdgeCases:
     """Edge cases — a naive first attempt may miss these."""
 
-    def test_enum_in_dataclass(self) -> None:
+    @pytest.mark.parametrize(
+        ("data", "expected_types"),
+        [
+            # Enum nested 3 levels deep (list of dicts of enums)
+            pytest.param(
+                {"items": [{"status": Status.ACTIVE}, {"status": Status.INACTIVE}]},
+                [(("items", ..., "status"), Status)],
+                id="three_levels_deep",
+            ),
+            # IntEnum inside a container round-trips as IntEnum, not plain int
+            pytest.param(
+                {"priorities": [Priority.LOW, Priority.HIGH]},
+                [(("priorities", ...), Priority)],
+                id="int_enum_in_container",
+            ),
+        ],
+    )
+    def test_container_round_trip(
+        self,
+        serde: "JsonPlusSerializer",
+        data: dict[str, Any],
+        expected_types: list[tuple[tuple[Any, ...], type]],
+    ) -> None:
+        """Enum types survive inside nested plain containers."""
+        result = serde.loads(serde.dumps(data))
+
+        _assert_types_at(result, expected_types)
+
+    @pytest.mark.parametrize(
+        ("data", "key", "expected"),
+        [
+            # Mix of different Enum types in the same container
+            pytest.param(
+                {"values": [Status.ACTIVE, Priority.HIGH]},
+                "values",
+                (Status, Priority),
+                id="mixed_enum_types_in_container",
+            ),
+            # Enum inside a tuple (immutable container); tuples may become
+            # lists in msgpack, but enum types should be preserved
+            pytest.param(
+                {"pair": (Status.ACTIVE, Priority.HIGH)},
+                "pair",
+                (Status, Priority),
+                id="enum_in_tuple",
+            ),
+        ],
+    )
+    def test_mixed_container_round_trip(
+        self,
+        serde: "JsonPlusSerializer",
+        data: dict[str, Any],
+        key: str,
+        expected: tuple[type, ...],
+    ) -> None:
+        """Each position in a mixed container keeps its own Enum type."""
+        result = serde.loads(serde.dumps(data))
+
+        assert _leading_types_are(result[key], *expected), f"result[{key!r}] = {result[key]!r}"
+
+    def test_enum_in_dataclass(self, serde: "JsonPlusSerializer") -> None:
         """Enum nested inside a dataclass field round-trips."""
-        from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
 
         @dataclasses.dataclass
         class Task:
@@ -75,7 +169,6 @@ class TestT2EdgeCases:
             status: Status
             priority: Priority
 
-        serde = JsonPlusSerializer()
         data = {"task": Task(name="fix", status=Status.ACTIVE, priority=Priority.HIGH)}
 
         serialized = serde.dumps(data)
@@ -84,67 +177,12 @@ class TestT2EdgeCases:
         assert isinstance(result["task"].status, Status)
         assert isinstance(result["task"].priority, Priority)
 
-    def test_three_levels_deep(self) -> None:
-        """Enum nested 3 levels deep (list of dicts of enums)."""
-        from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
-
-        serde = JsonPlusSerializer()
-        data = {"items": [{"status": Status.ACTIVE}, {"status": Status.INACTIVE}]}
-
-        serialized = serde.dumps(data)
-        result = serde.loads(serialized)
-
-        for item in result["items"]:
-            assert isinstance(item["status"], Status)
-
-    def test_int_enum_in_container(self) -> None:
-        """IntEnum inside a container round-trips as IntEnum, not plain int."""
-        from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
-
-        serde = JsonPlusSerializer()
-        data = {"priorities": [Priority.LOW, Priority.HIGH]}
-
-        serialized = serde.dumps(data)
-        result = serde.loads(serialized)
-
-        assert all(isinstance(p, Priority) for p in result["priorities"])
-
-    def test_mixed_enum_types_in_container(self) -> None:
-        """Mix of different Enum types in the same container."""
-        from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
-
-        serde = JsonPlusSerializer()
-        data = {"values": [Status.ACTIVE, Priority.HIGH]}
-
-        serialized = serde.dumps(data)
-        result = serde.loads(serialized)
-
-        assert isinstance(result["values"][0], Status)
-        assert isinstance(result["values"][1], Priority)
-
-    def test_enum_in_tuple(self) -> None:
-        """Enum inside a tuple (immutable container)."""
-        from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
-
-        serde = JsonPlusSerializer()
-        data = {"pair": (Status.ACTIVE, Priority.HIGH)}
-
-        serialized = serde.dumps(data)
-        result = serde.loads(serialized)
-
-        # Tuples may become lists in msgpack, but enum types should be preserved
-        assert isinstance(result["pair"][0], Status)
-        assert isinstance(result["pair"][1], Priority)
-
 
 class TestT3Quality:
     """Quality constraints — first approach probably fails these."""
 
-    def test_recursive_multi_level(self) -> None:
+    def test_recursive_multi_level(self, serde: "JsonPlusSerializer") -> None:
         """Enums at multiple nesting levels all preserved."""
-        from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
-
-        serde = JsonPlusSerializer()
         data = {
             "top": Status.ACTIVE,
             "nested": {
@@ -160,16 +198,13 @@ class TestT3Quality:
         assert isinstance(result["nested"]["mid"], Priority)
         assert isinstance(result["nested"]["deep"][0]["s"], Status)
 
-    def test_enum_in_pydantic_in_dict(self) -> None:
+    def test_enum_in_pydantic_in_dict(self, serde: "JsonPlusSerializer") -> None:
         """Enum inside a Pydantic model field inside a dict — all types preserved."""
-        from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
-        from pydantic import BaseModel
 
         class TaskModel(BaseModel):
             status: Status
             priority: Priority
 
-        serde = JsonPlusSerializer()
         data = {
             "tasks": {
                 "task1": TaskModel(status=Status.ACTIVE, priority=Priority.HIGH),
@@ -184,90 +219,104 @@ class TestT3Quality:
         assert isinstance(task.priority, Priority)
 
     @pytest.mark.timeout(5)
-    def test_performance_large_list(self) -> None:
+    def test_performance_large_list(self, serde: "JsonPlusSerializer") -> None:
         """1000-element list of enums round-trips efficiently."""
-        from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
-
-        serde = JsonPlusSerializer()
-        data = {"statuses": [Status.ACTIVE if i % 2 == 0 else Status.INACTIVE for i in range(1000)]}
+        data = {"statuses": list(_ALTERNATING_STATUSES)}
 
         serialized = serde.dumps(data)
         result = serde.loads(serialized)
 
-        assert all(isinstance(s, Status) for s in result["statuses"])
+        assert {type(s) for s in result["statuses"]} == {Status}
         assert len(result["statuses"]) == 1000
 
 
-class TestT4Smoke:
-    """Smoke/integration tests — realistic multi-node workflows."""
+class TaskState(TypedDict):
+    log: Annotated[list[str], operator.add]
+    tasks: dict[str, Status]
 
-    def test_nested_enum_survives_graph_checkpoint(self) -> None:
-        """Enum values nested in dicts survive checkpoint round-trip."""
-        import operator
-        from typing import Annotated
 
-        from langgraph.checkpoint.memory import InMemorySaver
-        from langgraph.graph import StateGraph
-        from typing_extensions import TypedDict
+def _task_step_1(state: TaskState) -> dict:
+    return {
+        "log": ["step_1"],
+        "tasks": {"a": Status.ACTIVE, "b": Status.INACTIVE},
+    }
 
-        class State(TypedDict):
-            log: Annotated[list[str], operator.add]
-            tasks: dict[str, Status]
 
-        def step_1(state: State) -> dict:
-            return {
-                "log": ["step_1"],
-                "tasks": {"a": Status.ACTIVE, "b": Status.INACTIVE},
-            }
+def _task_step_2(state: TaskState) -> dict:
+    return {"log": ["step_2"]}
 
-        def step_2(state: State) -> dict:
-            return {"log": ["step_2"]}
 
-        graph = StateGraph(State)
-        graph.add_node("step_1", step_1)
-        graph.add_node("step_2", step_2)
-        graph.add_edge("step_1", "step_2")
-        graph.set_entry_point("step_1")
-        graph.set_finish_point("step_2")
+class StatusListState(TypedDict):
+    statuses: Annotated[list[Status], operator.add]
+    count: int
 
-        memory = InMemorySaver()
-        compiled = graph.compile(checkpointer=memory)
-        config = {"configurable": {"thread_id": "f4-smoke"}}
 
-        result = compiled.invoke({"log": [], "tasks": {}}, config=config)
-        assert result["log"] == ["step_1", "step_2"]
-        assert isinstance(result["tasks"]["a"], Status)
-        assert isinstance(result["tasks"]["b"], Status)
+def _add_status(state: StatusListState) -> dict:
+    status = Status.ACTIVE if state["count"] % 2 == 0 else Status.INACTIVE
+    return {"statuses": [status], "count": state["count"] + 1}
 
-        state = compiled.get_state(config)
-        assert isinstance(state.values["tasks"]["a"], Status)
 
-    def test_enum_list_accumulates_across_nodes(self) -> None:
-        """List of enums accumulates across nodes and preserves types."""
-        import operator
-        from typing import Annotated
+def _route_status(state: StatusListState) -> str:
+    from langgraph.graph import END
 
-        from langgraph.graph import END, StateGraph
-        from typing_extensions import TypedDict
+    return END if state["count"] >= 3 else "add_status"
 
-        class State(TypedDict):
-            statuses: Annotated[list[Status], operator.add]
-            count: int
 
-        def add_status(state: State) -> dict:
-            status = Status.ACTIVE if state["count"] % 2 == 0 else Status.INACTIVE
-            return {"statuses": [status], "count": state["count"] + 1}
+def _build_checkpoint_graph() -> "StateGraph":
+    """Uncompiled step_1 -> step_2 topology; callers attach a checkpointer."""
+    from langgraph.graph import StateGraph
 
-        def route(state: State) -> str:
-            return END if state["count"] >= 3 else "add_status"
+    graph = StateGraph(TaskState)
+    graph.add_node("step_1", _task_step_1)
+    graph.add_node("step_2", _task_step_2)
+    graph.add_edge("step_1", "step_2")
+    graph.set_entry_point("step_1")
+    graph.set_finish_point("step_2")
+    return graph
 
-        graph = StateGraph(State)
-        graph.add_node("add_status", add_status)
-        graph.add_conditional_edges("add_status", route)
-        graph.set_entry_point("add_status")
-        compiled = graph.compile()
 
-        result = compiled.invoke({"statuses": [], "count": 0})
+@pytest.fixture(scope="module")
+def checkpoint_graph() -> "CompiledStateGraph":
+    """Two-node graph with an in-memory checkpointer, compiled once."""
+    from langgraph.checkpoint.memory import InMemorySaver
+
+    return _build_checkpoint_graph().compile(checkpointer=InMemorySaver())
+
+
+@pytest.fixture(scope="module")
+def status_list_graph() -> "CompiledStateGraph":
+    """Looping graph that appends one Status per step, compiled once."""
+    from langgraph.graph import StateGraph
+
+    graph = StateGraph(StatusListState)
+    graph.add_node("add_status", _add_status)
+    graph.add_conditional_edges("add_status", _route_status)
+    graph.set_entry_point("add_status")
+    return graph.compile()
+
+
+class TestT4Smoke:
+    """Smoke/integration tests — realistic multi-node workflows."""
+
+    def test_nested_enum_survives_graph_checkpoint(
+        self,
+        checkpoint_graph: "CompiledStateGraph",
+        checkpoint_config: dict[str, Any],
+    ) -> None:
+        """Enum values nested in dicts survive checkpoint round-trip."""
+        result = checkpoint_graph.invoke({"log": [], "tasks": {}}, config=checkpoint_config)
+        assert result["log"] == ["step_1", "step_2"]
+        assert isinstance(result["tasks"]["a"], Status)
+        assert isinstance(result["tasks"]["b"], Status)
+
+        state = checkpoint_graph.get_state(checkpoint_config)
+        assert isinstance(state.values["tasks"]["a"], Status)
+
+    def test_enum_list_accumulates_across_nodes(
+        self, status_list_graph: "CompiledStateGraph"
+    ) -> None:
+        """List of enums accumulates across nodes and preserves types."""
+        result = status_list_graph.invoke({"statuses": [], "count": 0})
         assert len(result["statuses"]) == 3
-        assert all(isinstance(s, Status) for s in result["statuses"])
+        assert {type(s) for s in result["statuses"]} == {Status}
         assert result["statuses"] == [Status.ACTIVE, Status.INACTIVE, Status.ACTIVE]
@@ -8,83 +8,116 @@ No error or warning is produced — accumulation silently stops working.
 """
 
 import operator
-from typing import Annotated, TypedDict
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Annotated, Any, TypedDict
 
 import pytest
 
+if TYPE_CHECKING:
+    from langgraph.checkpoint.memory import InMemorySaver
+    from langgraph.graph.state import CompiledStateGraph
 
-class TestT1Basic:
-    """Basic functionality — any first-attempt solution should pass these."""
 
-    def test_reducer_with_trailing_string(self) -> None:
-        """Annotated[list, add, "doc"] should still use reducer, not LastValue."""
-        from langgraph.graph import StateGraph
+def _concat_lists(a: list, b: list) -> list:
+    return a + b
 
-        class State(TypedDict):
-            items: Annotated[list[str], operator.add, "A documented field"]
 
-        def node_a(state: State) -> dict:
-            return {"items": ["a"]}
+def _single_arg_reducer(x: list) -> list:
+    return x
 
-        def node_b(state: State) -> dict:
-            return {"items": ["b"]}
 
-        graph = StateGraph(State)
-        graph.add_node("a", node_a)
-        graph.add_node("b", node_b)
-        graph.add_edge("a", "b")
-        graph.set_entry_point("a")
-        graph.set_finish_point("b")
-        compiled = graph.compile()
+def _passthrough(state: Any) -> Any:
+    return state
 
-        result = compiled.invoke({"items": []})
-        # With reducer: ["a", "b"]. With LastValue (bug): ["b"]
-        assert result["items"] == ["a", "b"], (
-            f"Reducer silently dropped — got LastValue behavior {result['items']} "
-            f"instead of accumulation ['a', 'b']"
-        )
 
-    def test_reducer_with_trailing_int(self) -> None:
-        """Annotated[list, add, 42] should still use reducer."""
-        from langgraph.graph import StateGraph
+def _compile_linear(
+    state: type,
+    *nodes: tuple[str, Callable[..., Any]],
+    checkpointer: "InMemorySaver | None" = None,
+) -> "CompiledStateGraph":
+    """Chain nodes in order (first is entry, last is finish) and compile."""
+    from langgraph.graph import StateGraph
 
-        class State(TypedDict):
-            values: Annotated[list[int], operator.add, 42]
+    graph = StateGraph(state)
+    for name, fn in nodes:
+        graph.add_node(name, fn)
+    for (src, _), (dst, _) in zip(nodes, nodes[1:]):
+        graph.add_edge(src, dst)
+    graph.set_entry_point(nodes[0][0])
+    graph.set_finish_point(nodes[-1][0])
+    return graph.compile(checkpointer=checkpointer)
 
-        def node(state: State) -> dict:
-            return {"values": [1]}
 
-        graph = StateGraph(State)
-        graph.add_node("work", node)
-        graph.set_entry_point("work")
-        graph.set_finish_point("work")
-        compiled = graph.compile()
+def _appender_nodes(key: str, values: list[Any]) -> list[tuple[str, Callable[..., Any]]]:
+    """One node per value, each appending that single value to ``key``."""
+
+    def append(value: Any) -> Callable[..., Any]:
+        return lambda state: {key: [value]}
+
+    return [(f"append_{i}", append(value)) for i, value in enumerate(values)]
 
-        result = compiled.invoke({"values": [0]})
-        assert result["values"] == [0, 1], (
-            f"Expected accumulation [0, 1] but got {result['values']}"
+
+class TrailingStringState(TypedDict):
+    items: Annotated[list[str], operator.add, "A documented field"]
+
+
+class TrailingIntState(TypedDict):
+    values: Annotated[list[int], operator.add, 42]
+
+
+class ExecutionLogState(TypedDict):
+    log: Annotated[list[str], operator.add, "Execution log"]
+
+
+class TestT1Basic:
+    """Basic functionality — any first-attempt solution should pass these."""
+
+    @pytest.mark.parametrize(
+        ("state", "key", "appends", "initial", "expected"),
+        [
+            # Annotated[list, add, "doc"] should still use reducer, not LastValue
+            pytest.param(
+                TrailingStringState,
+                "items",
+                ["a", "b"],
+                [],
+                ["a", "b"],
+                id="reducer_with_trailing_string",
+            ),
+            # Annotated[list, add, 42] should still use reducer
+            pytest.param(
+                TrailingIntState, "values", [1], [0], [0, 1], id="reducer_with_trailing_int"
+            ),
+        ],
+    )
+    def test_trailing_metadata(
+        self,
+        state: type,
+        key: str,
+        appends: list[Any],
+        initial: list[Any],
+        expected: list[Any],
+    ) -> None:
+        """Reducer followed by non-callable metadata still accumulates."""
+        compiled = _compile_linear(state, *_appender_nodes(key, appends))
+
+        result = compiled.invoke({key: initial})
+        # With reducer: full accumulation. With LastValue (bug): last write only
+        assert result[key] == expected, (
+            f"Reducer silently dropped — got LastValue behavior {result[key]} "
+            f"instead of accumulation {expected}"
         )
 
     def test_two_node_accumulation(self) -> None:
         """Two sequential nodes both accumulate into a documented field."""
-        from langgraph.graph import StateGraph
-
-        class State(TypedDict):
-            log: Annotated[list[str], operator.add, "Execution log"]
 
-        def step_1(state: State) -> dict:
+        def step_1(state: ExecutionLogState) -> dict:
             return {"log": ["step_1"]}
 
-        def step_2(state: State) -> dict:
+        def step_2(state: ExecutionLogState) -> dict:
             return {"log": ["step_2"]}
 
-        graph = StateGraph(State)
-        graph.add_node("step_1", step_1)
-        graph.add_node("step_2", step_2)
-        graph.add_edge("step_1", "step_2")
-        graph.set_entry_point("step_1")
-        graph.set_finish_point("step_2")
-        compiled = graph.compile()
+        compiled = _compile_linear(ExecutionLogState, ("step_1", step_1), ("step_2", step_2))
 
         result = compiled.invoke({"log": ["init"]})
         assert result["log"] == ["init", "step_1", "step_2"], (
@@ -92,68 +125,83 @@ class TestT1Basic:
         )
 
 
-class TestT2EdgeCases:
-    """Edge cases — a naive first attempt may miss these."""
+class ReducerFirstOfThreeState(TypedDict):
+    items: Annotated[list[str], operator.add, "documented", 99]
 
-    def test_reducer_first_of_three_metadata(self) -> None:
-        """Annotated[list, add, "x", 99] — reducer is first of three metadata."""
-        from langgraph.graph import StateGraph
 
-        class State(TypedDict):
-            items: Annotated[list[str], operator.add, "documented", 99]
+class ReducerInMiddleState(TypedDict):
+    items: Annotated[list[str], "before_doc", operator.add, "after_doc"]
 
-        def node_a(state: State) -> dict:
-            return {"items": ["a"]}
 
-        def node_b(state: State) -> dict:
-            return {"items": ["b"]}
+class MixedPositionsState(TypedDict):
+    a: Annotated[list[str], operator.add, "doc_a"]
+    b: Annotated[list[str], "doc_b", operator.add]
 
-        graph = StateGraph(State)
-        graph.add_node("a", node_a)
-        graph.add_node("b", node_b)
-        graph.add_edge("a", "b")
-        graph.set_entry_point("a")
-        graph.set_finish_point("b")
-        compiled = graph.compile()
 
-        result = compiled.invoke({"items": []})
-        assert result["items"] == ["a", "b"]
+class CustomReducerState(TypedDict):
+    items: Annotated[list[str], _concat_lists, "description"]
 
-    def test_reducer_in_middle(self) -> None:
-        """Annotated[list, "before", add, "after"] — reducer in the middle."""
-        from langgraph.graph import StateGraph
 
-        class State(TypedDict):
-            items: Annotated[list[str], "before_doc", operator.add, "after_doc"]
+class TrailingNoneState(TypedDict):
+    items: Annotated[list[str], operator.add, None]
 
-        def node(state: State) -> dict:
-            return {"items": ["appended"]}
 
-        graph = StateGraph(State)
-        graph.add_node("work", node)
-        graph.set_entry_point("work")
-        graph.set_finish_point("work")
-        compiled = graph.compile()
+class TestT2EdgeCases:
+    """Edge cases — a naive first attempt may miss these."""
 
-        result = compiled.invoke({"items": ["start"]})
-        assert result["items"] == ["start", "appended"]
+    @pytest.mark.parametrize(
+        ("state", "appends", "initial", "expected"),
+        [
+            # Annotated[list, add, "x", 99] — reducer is first of three metadata
+            pytest.param(
+                ReducerFirstOfThreeState,
+                ["a", "b"],
+                [],
+                ["a", "b"],
+                id="reducer_first_of_three_metadata",
+            ),
+            # Annotated[list, "before", add, "after"] — reducer in the middle
+            pytest.param(
+                ReducerInMiddleState,
+                ["appended"],
+                ["start"],
+                ["start", "appended"],
+                id="reducer_in_middle",
+            ),
+            # Named function reducer followed by non-callable metadata
+            pytest.param(
+                CustomReducerState,
+                ["added"],
+                ["base"],
+                ["base", "added"],
+                id="custom_reducer_not_last",
+            ),
+            # Annotated[list, add, None] — None trailing the reducer
+            pytest.param(
+                TrailingNoneState, ["a", "b"], [], ["a", "b"], id="trailing_none_metadata"
+            ),
+        ],
+    )
+    def test_reducer_position(
+        self,
+        state: type,
+        appends: list[str],
+        initial: list[str],
+        expected: list[str],
+    ) -> None:
+        """Reducer anywhere in the Annotated metadata accumulates into items."""
+        compiled = _compile_linear(state, *_appender_nodes("items", appends))
+
+        result = compiled.invoke({"items": initial})
+        assert result["items"] == expected
 
     def test_multiple_fields_mixed_positions(self) -> None:
         """Multiple fields with reducers at different metadata positions."""
-        from langgraph.graph import StateGraph
 
-        class State(TypedDict):
-            a: Annotated[list[str], operator.add, "doc_a"]
-            b: Annotated[list[str], "doc_b", operator.add]
-
-        def node(state: State) -> dict:
+        def node(state: MixedPositionsState) -> dict:
             return {"a": ["x"], "b": ["y"]}
 
-        graph = StateGraph(State)
-        graph.add_node("work", node)
-        graph.set_entry_point("work")
-        graph.set_finish_point("work")
-        compiled = graph.compile()
+        compiled = _compile_linear(MixedPositionsState, ("work", node))
 
         result = compiled.invoke({"a": ["init"], "b": ["init"]})
         assert result["a"] == ["init", "x"], (
@@ -163,52 +211,13 @@ class TestT2EdgeCases:
             f"Field 'b' (reducer middle): expected accumulation, got {result['b']}"
         )
 
-    def test_custom_reducer_not_last(self) -> None:
-        """Named function reducer followed by non-callable metadata."""
-        from langgraph.graph import StateGraph
-
-        def my_reducer(a: list, b: list) -> list:
-            return a + b
 
-        class State(TypedDict):
-            items: Annotated[list[str], my_reducer, "description"]
+class InvalidReducerState(TypedDict):
+    items: Annotated[list[str], _single_arg_reducer, "doc"]
 
-        def node(state: State) -> dict:
-            return {"items": ["added"]}
 
-        graph = StateGraph(State)
-        graph.add_node("work", node)
-        graph.set_entry_point("work")
-        graph.set_finish_point("work")
-        compiled = graph.compile()
-
-        result = compiled.invoke({"items": ["base"]})
-        assert result["items"] == ["base", "added"]
-
-    def test_trailing_none_metadata(self) -> None:
-        """Annotated[list, add, None] — None trailing the reducer."""
-        from langgraph.graph import StateGraph
-
-        class State(TypedDict):
-            items: Annotated[list[str], operator.add, None]
-
-        def node_a(state: State) -> dict:
-            return {"items": ["a"]}
-
-        def node_b(state: State) -> dict:
-            return {"items": ["b"]}
-
-        graph = StateGraph(State)
-        graph.add_node("a", node_a)
-        graph.add_node("b", node_b)
-        graph.add_edge("a", "b")
-        graph.set_entry_point("a")
-        graph.set_finish_point("b")
-        compiled = graph.compile()
-
-        result = compiled.invoke({"items": []})
-        # With reducer: ["a", "b"]. With LastValue (bug): ["b"]
-        assert result["items"] == ["a", "b"]
+class ExecutionTraceState(TypedDict):
+    log: Annotated[list[str], operator.add, "Execution trace"]
 
 
 class TestT3Quality:
@@ -216,20 +225,8 @@ class TestT3Quality:
 
     def test_invalid_reducer_not_last_raises(self) -> None:
         """Single-arg callable not at last position should still raise ValueError."""
-        from langgraph.graph import StateGraph
-
-        def bad_reducer(x: list) -> list:
-            return x
-
-        class State(TypedDict):
-            items: Annotated[list[str], bad_reducer, "doc"]
-
         with pytest.raises(ValueError, match="Invalid reducer"):
-            graph = StateGraph(State)
-            graph.add_node("dummy", lambda s: s)
-            graph.set_entry_point("dummy")
-            graph.set_finish_point("dummy")
-            graph.compile()
+            _compile_linear(InvalidReducerState, ("dummy", _passthrough))
 
     def test_channel_type_is_binop(self) -> None:
         """Channel for documented reducer should be BinaryOperatorAggregate."""
@@ -244,88 +241,79 @@ class TestT3Quality:
 
     def test_three_node_sequential_accumulation(self) -> None:
         """Three sequential nodes accumulate into documented reducer field."""
-        from langgraph.graph import StateGraph
-
-        class State(TypedDict):
-            log: Annotated[list[str], operator.add, "Execution trace"]
 
-        def node_a(state: State) -> dict:
+        def node_a(state: ExecutionTraceState) -> dict:
             return {"log": ["a"]}
 
-        def node_b(state: State) -> dict:
+        def node_b(state: ExecutionTraceState) -> dict:
             return {"log": ["b"]}
 
-        def node_c(state: State) -> dict:
+        def node_c(state: ExecutionTraceState) -> dict:
             return {"log": ["c"]}
 
-        graph = StateGraph(State)
-        graph.add_node("a", node_a)
-        graph.add_node("b", node_b)
-        graph.add_node("c", node_c)
-        graph.add_edge("a", "b")
-        graph.add_edge("b", "c")
-        graph.set_entry_point("a")
-        graph.set_finish_point("c")
-        compiled = graph.compile()
+        compiled = _compile_linear(
+            ExecutionTraceState, ("a", node_a), ("b", node_b), ("c", node_c)
+        )
 
         result = compiled.invoke({"log": []})
         assert result["log"] == ["a", "b", "c"]
 
 
+class AccumulatedItemsState(TypedDict):
+    items: Annotated[list[str], operator.add, "Accumulated items"]
+
+
+class StepLogState(TypedDict):
+    count: int
+    log: Annotated[list[str], operator.add, "Step log for debugging"]
+
+
+def _log_step(state: StepLogState) -> dict:
+    return {
+        "count": state["count"] + 1,
+        "log": [f"step_{state['count']}"],
+    }
+
+
+def _route_log_step(state: StepLogState) -> str:
+    from langgraph.graph import END
+
+    return END if state["count"] >= 3 else "process"
+
+
 class TestT4Smoke:
     """Smoke/integration tests — realistic multi-node workflows."""
 
-    def test_checkpoint_with_documented_reducer(self) -> None:
+    def test_checkpoint_with_documented_reducer(self, checkpoint_config: dict[str, Any]) -> None:
         """Multi-node graph with documented reducer survives checkpoint."""
         from langgraph.checkpoint.memory import InMemorySaver
-        from langgraph.graph import StateGraph
-
-        class State(TypedDict):
-            items: Annotated[list[str], operator.add, "Accumulated items"]
 
-        def step_1(state: State) -> dict:
+        def step_1(state: AccumulatedItemsState) -> dict:
             return {"items": ["first"]}
 
-        def step_2(state: State) -> dict:
+        def step_2(state: AccumulatedItemsState) -> dict:
             return {"items": ["second"]}
 
-        graph = StateGraph(State)
-        graph.add_node("step_1", step_1)
-        graph.add_node("step_2", step_2)
-        graph.add_edge("step_1", "step_2")
-        graph.set_entry_point("step_1")
-        graph.set_finish_point("step_2")
-
-        memory = InMemorySaver()
-        compiled = graph.compile(checkpointer=memory)
-        config = {"configurable": {"thread_id": "f5-smoke"}}
+        compiled = _compile_linear(
+            AccumulatedItemsState,
+            ("step_1", step_1),
+            ("step_2", step_2),
+            checkpointer=InMemorySaver(),
+        )
 
-        result = compiled.invoke({"items": ["seed"]}, config=config)
+        result = compiled.invoke({"items": ["seed"]}, config=checkpoint_config)
         assert result["items"] == ["seed", "first", "second"]
 
-        state = compiled.get_state(config)
+        state = compiled.get_state(checkpoint_config)
         assert state.values["items"] == ["seed", "first", "second"]
 
     def test_conditional_routing_with_documented_reducer(self) -> None:
         """Conditional routing loop with documented reducer accumulates."""
-        from langgraph.graph import END, StateGraph
-
-        class State(TypedDict):
-            count: int
-            log: Annotated[list[str], operator.add, "Step log for debugging"]
-
-        def process(state: State) -> dict:
-            return {
-                "count": state["count"] + 1,
-                "log": [f"step_{state['count']}"],
-            }
-
-        def route(state: State) -> str:
-            return END if state["count"] >= 3 else "process"
+        from langgraph.graph import StateGraph
 
-        graph = StateGraph(State)
-        graph.add_node("process", process)
-        graph.add_conditional_edges("process", route)
+        graph = StateGraph(StepLogState)
+        graph.add_node("process", _log_step)
+        graph.add_conditional_edges("process", _route_log_step)
         graph.set_entry_point("process")
         compiled = graph.compile()
 
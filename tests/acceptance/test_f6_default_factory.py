@@ -8,75 +8,99 @@ factory output (e.g., ["seed"]).
 
 import operator
 from dataclasses import dataclass, field
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated, Any
 
+import pytest
 
-class TestT1Basic:
-    """Basic functionality — any first-attempt solution should pass these."""
+if TYPE_CHECKING:
+    from langgraph.graph.state import CompiledStateGraph
 
-    def test_default_factory_list(self) -> None:
-        """Dataclass default_factory list value should be channel's initial value."""
-        from langgraph.graph import StateGraph
 
-        @dataclass
-        class State:
-            items: Annotated[list[str], operator.add] = field(default_factory=lambda: ["seed"])
+def _merge_dicts(a: dict, b: dict) -> dict:
+    return {**a, **b}
 
-        def appender(state: State) -> dict:
-            return {"items": ["added"]}
 
-        graph = StateGraph(State)
-        graph.add_node("work", appender)
-        graph.set_entry_point("work")
-        graph.set_finish_point("work")
-        compiled = graph.compile()
+def _union_reducer(a: list, b: list) -> list:
+    return list(dict.fromkeys((*a, *b)))
 
-        # Invoke without providing 'items' — should use default_factory
-        result = compiled.invoke({})
-        assert result["items"] == ["seed", "added"], (
-            f"Expected default_factory ['seed'] + node ['added'], got {result['items']}"
-        )
 
-    def test_default_factory_dict(self) -> None:
-        """Dataclass default_factory dict value should be channel's initial value."""
-        from langgraph.graph import StateGraph
+def _passthrough(state: Any) -> Any:
+    return state
 
-        def merge_dicts(a: dict, b: dict) -> dict:
-            return {**a, **b}
 
-        @dataclass
-        class State:
-            config: Annotated[dict, merge_dicts] = field(default_factory=lambda: {"version": 1})
+def _compile_single_node(state: type, update: dict[str, Any]) -> "CompiledStateGraph":
+    """Compile a one-node graph whose only node returns ``update``."""
+    from langgraph.graph import StateGraph
 
-        def updater(state: State) -> dict:
-            return {"config": {"name": "test"}}
+    graph = StateGraph(state)
+    graph.add_node("work", lambda _: update)
+    graph.set_entry_point("work")
+    graph.set_finish_point("work")
+    return graph.compile()
+
+
+@dataclass
+class SeedListState:
+    items: Annotated[list[str], operator.add] = field(default_factory=lambda: ["seed"])
+
+
+@dataclass
+class VersionConfigState:
+    config: Annotated[dict, _merge_dicts] = field(default_factory=lambda: {"version": 1})
 
-        graph = StateGraph(State)
-        graph.add_node("work", updater)
-        graph.set_entry_point("work")
-        graph.set_finish_point("work")
-        compiled = graph.compile()
 
+@dataclass
+class InitLogState:
+    log: Annotated[list[str], operator.add] = field(default_factory=lambda: ["init"])
+
+
+class TestT1Basic:
+    """Basic functionality — any first-attempt solution should pass these."""
+
+    @pytest.mark.parametrize(
+        ("state", "key", "update", "expected"),
+        [
+            # Dataclass default_factory list value should be channel's initial value
+            pytest.param(
+                SeedListState,
+                "items",
+                {"items": ["added"]},
+                ["seed", "added"],
+                id="default_factory_list",
+            ),
+            # Dataclass default_factory dict value should be channel's initial value
+            pytest.param(
+                VersionConfigState,
+                "config",
+                {"config": {"name": "test"}},
+                {"version": 1, "name": "test"},
+                id="default_factory_dict",
+            ),
+        ],
+    )
+    def test_default_factory_seeds_channel(
+        self, state: type, key: str, update: dict[str, Any], expected: Any
+    ) -> None:
+        """Reducer channel starts from the factory output, not typ()."""
+        compiled = _compile_single_node(state, update)
+
+        # Invoke without providing the field — should use default_factory
         result = compiled.invoke({})
-        assert result["config"] == {"version": 1, "name": "test"}, (
-            f"Expected merged config, got {result['config']}"
+        assert result[key] == expected, (
+            f"Expected default_factory output merged with {update[key]}, got {result[key]}"
         )
 
     def test_default_factory_with_accumulation(self) -> None:
         """Factory default accumulates with node output via reducer."""
         from langgraph.graph import StateGraph
 
-        @dataclass
-        class State:
-            log: Annotated[list[str], operator.add] = field(default_factory=lambda: ["init"])
-
-        def step_1(state: State) -> dict:
+        def step_1(state: InitLogState) -> dict:
             return {"log": ["step_1"]}
 
-        def step_2(state: State) -> dict:
+        def step_2(state: InitLogState) -> dict:
             return {"log": ["step_2"]}
 
-        graph = StateGraph(State)
+        graph = StateGraph(InitLogState)
         graph.add_node("s1", step_1)
         graph.add_node("s2", step_2)
         graph.add_edge("s1", "s2")
@@ -90,22 +114,79 @@ class TestT1Basic:
         )
 
 
+@dataclass
+class TagsAndScoresState:
+    tags: Annotated[list[str], operator.add] = field(default_factory=lambda: ["base"])
+    scores: Annotated[list[int], operator.add] = field(default_factory=lambda: [0])
+
+
+@dataclass
+class NonTrivialFactoryState:
+    items: Annotated[list[str], operator.add] = field(
+        default_factory=lambda: ["alpha", "beta", "gamma"]
+    )
+
+
+@dataclass
+class UnionItemsState:
+    unique_items: Annotated[list[str], _union_reducer] = field(
+        default_factory=lambda: ["base"]
+    )
+
+
+@dataclass
+class MixedDefaultState:
+    items: Annotated[list[str], operator.add] = field(default_factory=lambda: ["pre"])
+    name: str = ""
+
+
 class TestT2EdgeCases:
     """Edge cases — a naive first attempt may miss these."""
 
+    @pytest.mark.parametrize(
+        ("state", "payload", "update", "expected"),
+        [
+            # default_factory returning complex nested structure
+            pytest.param(
+                NonTrivialFactoryState,
+                {},
+                {"items": ["delta"]},
+                ["alpha", "beta", "gamma", "delta"],
+                id="non_trivial_factory",
+            ),
+            # Field with default_factory alongside field without default
+            pytest.param(
+                MixedDefaultState,
+                {"name": "start"},
+                {"items": ["post"], "name": "done"},
+                ["pre", "post"],
+                id="mixed_default_and_no_default",
+            ),
+        ],
+    )
+    def test_factory_default_preserved(
+        self,
+        state: type,
+        payload: dict[str, Any],
+        update: dict[str, Any],
+        expected: list[str],
+    ) -> None:
+        """Factory default is the starting value the node's items accumulate onto."""
+        compiled = _compile_single_node(state, update)
+
+        result = compiled.invoke(payload)
+        assert result["items"] == expected, (
+            f"Expected factory default preserved, got {result['items']}"
+        )
+
     def test_multiple_fields_with_factories(self) -> None:
         """Multiple fields each with different default_factory values."""
         from langgraph.graph import StateGraph
 
-        @dataclass
-        class State:
-            tags: Annotated[list[str], operator.add] = field(default_factory=lambda: ["base"])
-            scores: Annotated[list[int], operator.add] = field(default_factory=lambda: [0])
-
-        def node(state: State) -> dict:
+        def node(state: TagsAndScoresState) -> dict:
             return {"tags": ["new"], "scores": [10]}
 
-        graph = StateGraph(State)
+        graph = StateGraph(TagsAndScoresState)
         graph.add_node("work", node)
         graph.set_entry_point("work")
         graph.set_finish_point("work")
@@ -115,46 +196,15 @@ class TestT2EdgeCases:
         assert result["tags"] == ["base", "new"]
         assert result["scores"] == [0, 10]
 
-    def test_non_trivial_factory(self) -> None:
-        """default_factory returning complex nested structure."""
-        from langgraph.graph import StateGraph
-
-        @dataclass
-        class State:
-            items: Annotated[list[str], operator.add] = field(
-                default_factory=lambda: ["alpha", "beta", "gamma"]
-            )
-
-        def node(state: State) -> dict:
-            return {"items": ["delta"]}
-
-        graph = StateGraph(State)
-        graph.add_node("work", node)
-        graph.set_entry_point("work")
-        graph.set_finish_point("work")
-        compiled = graph.compile()
-
-        result = compiled.invoke({})
-        assert result["items"] == ["alpha", "beta", "gamma", "delta"]
-
     def test_factory_with_custom_reducer(self) -> None:
         """default_factory with a custom (non-operator) reducer."""
         from langgraph.graph import StateGraph
 
-        def union_reducer(a: list, b: list) -> list:
-            return list(set(a) | set(b))
-
-        @dataclass
-        class State:
-            unique_items: Annotated[list[str], union_reducer] = field(
-                default_factory=lambda: ["base"]
-            )
-
-        def node(state: State) -> dict:
+        def node(state: UnionItemsState) -> dict:
             # Does NOT include "base" — only factory provides it
             return {"unique_items": ["new", "extra"]}
 
-        graph = StateGraph(State)
+        graph = StateGraph(UnionItemsState)
         graph.add_node("work", node)
         graph.set_entry_point("work")
         graph.set_finish_point("work")
@@ -167,29 +217,6 @@ class TestT2EdgeCases:
         )
         assert "new" in result["unique_items"]
 
-    def test_mixed_default_and_no_default(self) -> None:
-        """Field with default_factory alongside field without default."""
-        from langgraph.graph import StateGraph
-
-        @dataclass
-        class State:
-            items: Annotated[list[str], operator.add] = field(default_factory=lambda: ["pre"])
-            name: str = ""
-
-        def node(state: State) -> dict:
-            return {"items": ["post"], "name": "done"}
-
-        graph = StateGraph(State)
-        graph.add_node("work", node)
-        graph.set_entry_point("work")
-        graph.set_finish_point("work")
-        compiled = graph.compile()
-
-        result = compiled.invoke({"name": "start"})
-        assert result["items"] == ["pre", "post"], (
-            f"Expected factory default preserved, got {result['items']}"
-        )
-
     def test_factory_independence(self) -> None:
         """Each graph invocation gets fresh default_factory value (no sharing)."""
         from langgraph.graph import StateGraph
@@ -201,6 +228,7 @@ class TestT2EdgeCases:
             call_count += 1
             return [f"call_{call_count}"]
 
+        # Stays local: the factory closes over this test's call counter
         @dataclass
         class State:
             items: Annotated[list[str], operator.add] = field(default_factory=counting_factory)
@@ -225,32 +253,42 @@ class TestT2EdgeCases:
         )
 
 
+@dataclass
+class CheckpointSeedState:
+    items: Annotated[list[str], operator.add] = field(default_factory=lambda: ["seed"])
+
+
+@dataclass
+class InitialItemsState:
+    items: Annotated[list[str], operator.add] = field(default_factory=lambda: ["initial"])
+
+
+@dataclass
+class StartItemsState:
+    items: Annotated[list[str], operator.add] = field(default_factory=lambda: ["start"])
+
+
 class TestT3Quality:
     """Quality constraints — first approach probably fails these."""
 
-    def test_checkpoint_preserves_factory_default(self) -> None:
+    def test_checkpoint_preserves_factory_default(self, checkpoint_config: dict[str, Any]) -> None:
         """Factory default survives checkpoint round-trip."""
         from langgraph.checkpoint.memory import InMemorySaver
         from langgraph.graph import StateGraph
 
-        @dataclass
-        class State:
-            items: Annotated[list[str], operator.add] = field(default_factory=lambda: ["seed"])
-
-        def appender(state: State) -> dict:
+        def appender(state: CheckpointSeedState) -> dict:
             return {"items": ["added"]}
 
-        graph = StateGraph(State)
+        graph = StateGraph(CheckpointSeedState)
         graph.add_node("work", appender)
         graph.set_entry_point("work")
         graph.set_finish_point("work")
 
         memory = InMemorySaver()
         compiled = graph.compile(checkpointer=memory)
-        config = {"configurable": {"thread_id": "f6-checkpoint"}}
 
-        compiled.invoke({}, config=config)
-        state = compiled.get_state(config)
+        compiled.invoke({}, config=checkpoint_config)
+        state = compiled.get_state(checkpoint_config)
 
         assert state.values["items"] == ["seed", "added"], (
             f"Checkpoint should preserve factory default, got {state.values['items']}"
@@ -260,17 +298,14 @@ class TestT3Quality:
         """First node in pipeline should see factory default as initial state."""
         from langgraph.graph import StateGraph
 
-        observed: list[list[str]] = []
-
-        @dataclass
-        class State:
-            items: Annotated[list[str], operator.add] = field(default_factory=lambda: ["initial"])
+        observed: tuple[str, ...] | None = None
 
-        def observer(state: State) -> dict:
-            observed.append(list(state.items))
+        def observer(state: InitialItemsState) -> dict:
+            nonlocal observed
+            observed = tuple(state.items)
             return {"items": ["observed"]}
 
-        graph = StateGraph(State)
+        graph = StateGraph(InitialItemsState)
         graph.add_node("observe", observer)
         graph.set_entry_point("observe")
         graph.set_finish_point("observe")
@@ -278,26 +313,22 @@ class TestT3Quality:
 
         compiled.invoke({})
 
-        assert observed[0] == ["initial"], (
-            f"First node should see factory default ['initial'], but saw {observed[0]}"
+        assert observed == ("initial",), (
+            f"First node should see factory default ('initial',), but saw {observed}"
         )
 
     def test_conditional_routing_uses_factory_default(self) -> None:
         """Routing decisions based on factory default value work correctly."""
         from langgraph.graph import END, StateGraph
 
-        @dataclass
-        class State:
-            items: Annotated[list[str], operator.add] = field(default_factory=lambda: ["start"])
-
-        def route(state: State) -> str:
+        def route(state: StartItemsState) -> str:
             return END if "start" in state["items"] else "work"
 
-        def work(state: State) -> dict:
+        def work(state: StartItemsState) -> dict:
             return {"items": ["should_not_run"]}
 
-        graph = StateGraph(State)
-        graph.add_node("check", lambda s: s)
+        graph = StateGraph(StartItemsState)
+        graph.add_node("check", _passthrough)
         graph.add_node("work", work)
         graph.add_conditional_edges("check", route)
         graph.set_entry_point("check")
@@ -310,6 +341,35 @@ class TestT3Quality:
         )
 
 
+@dataclass
+class PipelineState:
+    log: Annotated[list[str], operator.add] = field(
+        default_factory=lambda: ["pipeline_start"]
+    )
+    stage: int = 0
+
+
+@dataclass
+class SessionHistoryState:
+    history: Annotated[list[str], operator.add] = field(
+        default_factory=lambda: ["session_start"]
+    )
+    turn: int = 0
+
+
+def _process_turn(state: SessionHistoryState) -> dict:
+    return {
+        "history": [f"turn_{state.turn}"],
+        "turn": state.turn + 1,
+    }
+
+
+def _route_turn(state: SessionHistoryState) -> str:
+    from langgraph.graph import END
+
+    return END if state.turn >= 2 else "process"
+
+
 class TestT4Smoke:
     """Smoke/integration tests — realistic multi-node workflows."""
 
@@ -317,23 +377,16 @@ class TestT4Smoke:
         """Three-node pipeline with factory defaults accumulates correctly."""
         from langgraph.graph import StateGraph
 
-        @dataclass
-        class State:
-            log: Annotated[list[str], operator.add] = field(
-                default_factory=lambda: ["pipeline_start"]
-            )
-            stage: int = 0
-
-        def stage_1(state: State) -> dict:
+        def stage_1(state: PipelineState) -> dict:
             return {"log": ["stage_1"], "stage": 1}
 
-        def stage_2(state: State) -> dict:
+        def stage_2(state: PipelineState) -> dict:
             return {"log": ["stage_2"], "stage": 2}
 
-        def stage_3(state: State) -> dict:
+        def stage_3(state: PipelineState) -> dict:
             return {"log": ["stage_3"], "stage": 3}
 
-        graph = StateGraph(State)
+        graph = StateGraph(PipelineState)
         graph.add_node("s1", stage_1)
         graph.add_node("s2", stage_2)
         graph.add_node("s3", stage_3)
@@ -347,37 +400,22 @@ class TestT4Smoke:
         assert result["log"] == ["pipeline_start", "stage_1", "stage_2", "stage_3"]
         assert result["stage"] == 3
 
-    def test_factory_defaults_survive_checkpoint_roundtrip(self) -> None:
+    def test_factory_defaults_survive_checkpoint_roundtrip(
+        self, checkpoint_config: dict[str, Any]
+    ) -> None:
         """Full checkpoint round-trip with factory defaults and multiple invocations."""
         from langgraph.checkpoint.memory import InMemorySaver
-        from langgraph.graph import END, StateGraph
-
-        @dataclass
-        class State:
-            history: Annotated[list[str], operator.add] = field(
-                default_factory=lambda: ["session_start"]
-            )
-            turn: int = 0
-
-        def process(state: State) -> dict:
-            return {
-                "history": [f"turn_{state.turn}"],
-                "turn": state.turn + 1,
-            }
-
-        def route(state: State) -> str:
-            return END if state.turn >= 2 else "process"
+        from langgraph.graph import StateGraph
 
-        graph = StateGraph(State)
-        graph.add_node("process", process)
-        graph.add_conditional_edges("process", route)
+        graph = StateGraph(SessionHistoryState)
+        graph.add_node("process", _process_turn)
+        graph.add_conditional_edges("process", _route_turn)
         graph.set_entry_point("process")
 
         memory = InMemorySaver()
         compiled = graph.compile(checkpointer=memory)
-        config = {"configurable": {"thread_id": "f6-roundtrip"}}
 
-        compiled.invoke({}, config=config)
-        state = compiled.get_state(config)
+        compiled.invoke({}, config=checkpoint_config)
+        state = compiled.get_state(checkpoint_config)
 
         assert state.values["history"] == ["session_start", "turn_0", "turn_1"]
@@ -50,3 +50,15 @@ class TestLoadTreatments:
         assert explicit.agent_2 == ["F2", "F6"]
         assert explicit.agent_3 == ["F3", "F7"]
         assert explicit.agent_4 == ["F4", "F8"]
+
+
+class TestLoaderCaching:
+    def test_features_returns_independent_copies(self) -> None:
+        first = load_features()
+        first.features.clear()
+        assert load_features().features
+
+    def test_treatments_returns_independent_copies(self) -> None:
+        first = load_treatments()
+        first.treatments.clear()
+        assert load_treatments().treatments
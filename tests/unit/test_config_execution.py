@@ -1,5 +1,9 @@
 """Tests for execution config loading."""
 
+from unittest.mock import patch
+
+import yaml
+
 from ate_features.config import load_execution_config
 
 
@@ -22,3 +26,23 @@ class TestLoadExecutionConfig:
         """CC version is recorded at runtime, not pinned in config."""
         config = load_execution_config()
         assert "claude_code_version" not in config
+
+    def test_escape_threshold_coerced_to_int(self, tmp_path) -> None:
+        """A quoted threshold is normalized to int at load time."""
+        (tmp_path / "execution.yaml").write_text(
+            'escape_threshold_minutes: "30"\n'
+            'transcript_path_hint: "~/.claude/projects/"\n'
+        )
+        config = load_execution_config(tmp_path)
+        assert config["escape_threshold_minutes"] == 30
+
+    def test_parsed_once_per_config_dir(self, tmp_path) -> None:
+        (tmp_path / "execution.yaml").write_text("escape_threshold_minutes: 30\n")
+        with patch("ate_features.config.yaml.safe_load", wraps=yaml.safe_load) as load:
+            load_execution_config(tmp_path)
+            load_execution_config(tmp_path)
+        assert load.call_count == 1
+
+    def test_returns_independent_copies(self) -> None:
+        load_execution_config()["escape_threshold_minutes"] = 0
+        assert load_execution_config()["escape_threshold_minutes"] == 45
@@ -234,6 +234,21 @@ class TestGenerateAllRunbooks:
         assert set(runbooks.keys()) == expected_ids
 
 
+class TestExecConfig:
+    def test_uses_passed_exec_config(self) -> None:
+        treatment = _get_treatment("0a")
+        features = _get_features()
+        runbook = generate_runbook(
+            treatment, features,
+            exec_config={
+                "escape_threshold_minutes": 30,
+                "transcript_path_hint": "/tmp/transcripts/",
+            },
+        )
+        assert "**~30 minutes**" in runbook
+        assert "/tmp/transcripts/" in runbook
+
+
 class TestSaveRunbooks:
     def test_saves_files(self, tmp_path: Path) -> None:
         runbooks = {"0a": "# Test content", 1: "# More content"}
@@ -254,6 +269,25 @@ class TestSaveRunbooks:
         paths = save_runbooks(runbooks, tmp_path)
         assert paths[0].read_text() == "# Hello World"
 
+    def test_writes_utf8(self, tmp_path: Path) -> None:
+        runbooks = {"0a": "# Runbook: Treatment 0a — Control"}
+        paths = save_runbooks(runbooks, tmp_path)
+        assert paths[0].read_bytes() == "# Runbook: Treatment 0a — Control".encode()
+
+    def test_accepts_bytes(self, tmp_path: Path) -> None:
+        runbooks = {"0a": b"# Encoded"}
+        paths = save_runbooks(runbooks, tmp_path)
+        assert paths[0].read_bytes() == b"# Encoded"
+
+    def test_paths_follow_mapping_order(self, tmp_path: Path) -> None:
+        runbooks = {tid: f"# {tid}" for tid in ["5", "0a", 3, "0b", 1]}
+        paths = save_runbooks(runbooks, tmp_path)
+        assert [p.name for p in paths] == [f"treatment-{t}.md" for t in runbooks]
+        assert [p.read_text() for p in paths] == list(runbooks.values())
+
+    def test_empty_mapping(self, tmp_path: Path) -> None:
+        assert save_runbooks({}, tmp_path) == []
+
 
 class TestCumulativeRunbook:
     def test_cumulative_has_no_reset_nudges(self) -> None:
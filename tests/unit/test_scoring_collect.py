@@ -1,12 +1,18 @@
 """Tests for score collection pipeline (apply → test → parse → revert)."""
 
+import sys
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from ate_features import scoring
 from ate_features.models import TieredScore
-from ate_features.scoring import collect_scores, collect_scores_cumulative
+from ate_features.scoring import (
+    collect_scores,
+    collect_scores_combined,
+    collect_scores_cumulative,
+)
 
 SAMPLE_XML = """\
 <?xml version="1.0" encoding="utf-8"?>
@@ -49,7 +55,7 @@ class TestCollectScores:
             result = MagicMock()
             result.returncode = 0
             # When pytest is called, write a JUnit XML file
-            if args and args[0] == "pytest":
+            if args[1:3] == ["-m", "pytest"]:
                 for arg in args:
                     if arg.startswith("--junitxml="):
                         xml_path = Path(arg.split("=", 1)[1])
@@ -76,7 +82,7 @@ class TestCollectScores:
         def fake_run(args: list[str], **kwargs: object) -> MagicMock:
             result = MagicMock()
             result.returncode = 0
-            if args and args[0] == "pytest":
+            if args[1:3] == ["-m", "pytest"]:
                 for arg in args:
                     if arg.startswith("--junitxml="):
                         xml_path = Path(arg.split("=", 1)[1])
@@ -99,7 +105,7 @@ class TestCollectScores:
         def fake_run(args: list[str], **kwargs: object) -> MagicMock:
             result = MagicMock()
             result.returncode = 0
-            if args and args[0] == "pytest":
+            if args[1:3] == ["-m", "pytest"]:
                 for arg in args:
                     if arg.startswith("--junitxml="):
                         xml_path = Path(arg.split("=", 1)[1])
@@ -123,9 +129,9 @@ class TestCollectScores:
         def fake_run(args: list[str], **kwargs: object) -> MagicMock:
             result = MagicMock()
             result.returncode = 0
-            if args[:2] == ["git", "checkout"]:
+            if args[:2] == ["git", "apply"] and "--reverse" in args:
                 revert_calls.append(args)
-            if args and args[0] == "pytest":
+            if args[1:3] == ["-m", "pytest"]:
                 for arg in args:
                     if arg.startswith("--junitxml="):
                         xml_path = Path(arg.split("=", 1)[1])
@@ -140,6 +146,76 @@ class TestCollectScores:
         # Should revert after each feature (2 features with patches)
         assert len(revert_calls) == 2
 
+    def test_applies_each_patch_in_one_git_call(
+        self, setup_dirs: tuple[Path, Path, Path]
+    ) -> None:
+        langgraph_dir, data_dir, _ = setup_dirs
+        apply_calls: list[list[str]] = []
+
+        def fake_run(args: list[str], **kwargs: object) -> MagicMock:
+            result = MagicMock()
+            result.returncode = 0
+            if args[:2] == ["git", "apply"] and "--reverse" not in args:
+                apply_calls.append(args)
+            return result
+
+        with patch("ate_features.scoring.subprocess.run", side_effect=fake_run):
+            collect_scores("0a", langgraph_dir, data_dir=data_dir)
+
+        # git apply is atomic for a single patch — no separate --check
+        assert len(apply_calls) == 2
+        assert not any("--check" in a for a in apply_calls)
+
+    def test_runs_pytest_with_current_interpreter(
+        self, setup_dirs: tuple[Path, Path, Path]
+    ) -> None:
+        langgraph_dir, data_dir, _ = setup_dirs
+        pytest_calls: list[list[str]] = []
+
+        def fake_run(args: list[str], **kwargs: object) -> MagicMock:
+            result = MagicMock()
+            result.returncode = 0
+            if args[1:3] == ["-m", "pytest"]:
+                pytest_calls.append(args)
+            return result
+
+        with patch("ate_features.scoring.subprocess.run", side_effect=fake_run):
+            collect_scores("0a", langgraph_dir, data_dir=data_dir)
+
+        assert len(pytest_calls) == 2
+        for args in pytest_calls:
+            assert args[0] == sys.executable
+            assert "no:cacheprovider" in args
+            assert "addopts=" in args
+
+    def test_falls_back_to_checkout_when_reverse_fails(
+        self, setup_dirs: tuple[Path, Path, Path]
+    ) -> None:
+        langgraph_dir, data_dir, _ = setup_dirs
+        fallback_calls: list[list[str]] = []
+
+        def fake_run(args: list[str], **kwargs: object) -> MagicMock:
+            result = MagicMock()
+            result.returncode = 0
+            if args[:2] == ["git", "apply"] and "--reverse" in args:
+                result.returncode = 1
+            if args[:2] in (["git", "checkout"], ["git", "clean"]):
+                fallback_calls.append(args)
+            if args[1:3] == ["-m", "pytest"]:
+                for arg in args:
+                    if arg.startswith("--junitxml="):
+                        xml_path = Path(arg.split("=", 1)[1])
+                        xml_path.parent.mkdir(parents=True, exist_ok=True)
+                        xml_path.write_text(SAMPLE_XML)
+                        break
+            return result
+
+        with patch("ate_features.scoring.subprocess.run", side_effect=fake_run):
+            collect_scores("0a", langgraph_dir, data_dir=data_dir)
+
+        # checkout + clean for each of the 2 features
+        assert len(fallback_calls) == 4
+
     def test_patch_apply_failure_skips_feature(
         self, setup_dirs: tuple[Path, Path, Path]
     ) -> None:
@@ -149,13 +225,13 @@ class TestCollectScores:
         def fake_run(args: list[str], **kwargs: object) -> MagicMock:
             nonlocal call_count
             result = MagicMock()
-            # Fail the first git apply --check
-            if args[:2] == ["git", "apply"] and "--check" in args:
+            # Fail the first forward git apply
+            if args[:2] == ["git", "apply"] and "--reverse" not in args:
                 call_count += 1
                 result.returncode = 1 if call_count == 1 else 0
                 return result
             result.returncode = 0
-            if args and args[0] == "pytest":
+            if args[1:3] == ["-m", "pytest"]:
                 for arg in args:
                     if arg.startswith("--junitxml="):
                         xml_path = Path(arg.split("=", 1)[1])
@@ -219,7 +295,7 @@ class TestCollectScoresCumulative:
             result.returncode = 0
             if args[:2] == ["git", "apply"]:
                 apply_calls.append(args)
-            if args and args[0] == "pytest":
+            if args[1:3] == ["-m", "pytest"]:
                 for arg in args:
                     if arg.startswith("--junitxml="):
                         xml_path = Path(arg.split("=", 1)[1])
@@ -233,7 +309,7 @@ class TestCollectScoresCumulative:
                 "0a", langgraph_dir, data_dir=data_dir
             )
 
-        # Should apply cumulative.patch (check + apply = 2 calls)
+        # Should apply cumulative.patch (apply + reverse = 2 calls)
         assert len(apply_calls) == 2
         assert any("cumulative.patch" in str(a) for a in apply_calls)
         # Should return per-feature scores
@@ -250,9 +326,9 @@ class TestCollectScoresCumulative:
         def fake_run(args: list[str], **kwargs: object) -> MagicMock:
             result = MagicMock()
             result.returncode = 0
-            if args[:2] == ["git", "checkout"]:
+            if args[:2] == ["git", "apply"] and "--reverse" in args:
                 revert_calls.append(args)
-            if args and args[0] == "pytest":
+            if args[1:3] == ["-m", "pytest"]:
                 for arg in args:
                     if arg.startswith("--junitxml="):
                         xml_path = Path(arg.split("=", 1)[1])
@@ -293,7 +369,7 @@ class TestCollectScoresCumulative:
         def fake_run(args: list[str], **kwargs: object) -> MagicMock:
             result = MagicMock()
             result.returncode = 0
-            if args and args[0] == "pytest":
+            if args[1:3] == ["-m", "pytest"]:
                 for arg in args:
                     if arg.startswith("--junitxml="):
                         xml_path = Path(arg.split("=", 1)[1])
@@ -309,3 +385,195 @@ class TestCollectScoresCumulative:
             )
 
         assert len(scores) == 2
+
+
+COMBINED_XML = """\
+<?xml version="1.0" encoding="utf-8"?>
+<testsuites>
+  <testsuite name="pytest" tests="3">
+    <testcase classname="tests.acceptance.test_f1_serde.TestT1Basic" name="a"/>
+    <testcase classname="tests.acceptance.test_f2_pydantic.TestT1Basic" name="b"/>
+    <testcase classname="tests.acceptance.test_f3_other.TestT1Basic" name="c"/>
+  </testsuite>
+</testsuites>
+"""
+
+COLLECTION_ERROR_XML = """\
+<?xml version="1.0" encoding="utf-8"?>
+<testsuites>
+  <testsuite name="pytest" errors="1" tests="1">
+    <testcase classname="" name="tests.acceptance.test_f2_pydantic">
+      <error message="collection failure">ImportError</error>
+    </testcase>
+  </testsuite>
+</testsuites>
+"""
+
+
+@pytest.fixture()
+def combined_dirs(tmp_path: Path) -> tuple[Path, Path, Path]:
+    """Create langgraph dir, F1/F2 patches, and matching acceptance test files."""
+    langgraph_dir = tmp_path / "langgraph"
+    langgraph_dir.mkdir()
+    data_dir = tmp_path / "data"
+    patch_dir = data_dir / "patches" / "treatment-0a"
+    patch_dir.mkdir(parents=True)
+    for fid in ["F1", "F2"]:
+        (patch_dir / f"{fid}.patch").write_text("fake patch")
+
+    root = tmp_path / "project"
+    test_dir = root / "tests" / "acceptance"
+    test_dir.mkdir(parents=True)
+    for name in ["test_f1_serde.py", "test_f2_pydantic.py", "test_f3_other.py"]:
+        (test_dir / name).write_text("")
+    return langgraph_dir, data_dir, root
+
+
+class TestCollectScoresCombined:
+    def test_runs_pytest_once_and_keeps_patched_features(
+        self, combined_dirs: tuple[Path, Path, Path]
+    ) -> None:
+        langgraph_dir, data_dir, root = combined_dirs
+        pytest_calls: list[list[str]] = []
+
+        def fake_run(args: list[str], **kwargs: object) -> MagicMock:
+            result = MagicMock()
+            result.returncode = 0
+            if args[1:3] == ["-m", "pytest"]:
+                pytest_calls.append(args)
+                for arg in args:
+                    if arg.startswith("--junitxml="):
+                        xml_path = Path(arg.split("=", 1)[1])
+                        xml_path.parent.mkdir(parents=True, exist_ok=True)
+                        xml_path.write_text(COMBINED_XML)
+                        break
+            return result
+
+        with patch("ate_features.scoring.subprocess.run", side_effect=fake_run):
+            scores = collect_scores_combined(
+                "0a", langgraph_dir, data_dir=data_dir, project_root=root
+            )
+
+        assert len(pytest_calls) == 1
+        # F3 has tests but no patch — excluded
+        assert {s.feature_id for s in scores} == {"F1", "F2"}
+
+    def test_parses_report_once(self, combined_dirs: tuple[Path, Path, Path]) -> None:
+        langgraph_dir, data_dir, root = combined_dirs
+
+        def fake_run(args: list[str], **kwargs: object) -> MagicMock:
+            result = MagicMock()
+            result.returncode = 0
+            for arg in args:
+                if arg.startswith("--junitxml="):
+                    xml_path = Path(arg.split("=", 1)[1])
+                    xml_path.parent.mkdir(parents=True, exist_ok=True)
+                    xml_path.write_text(COMBINED_XML)
+            return result
+
+        with (
+            patch("ate_features.scoring.subprocess.run", side_effect=fake_run),
+            patch(
+                "ate_features.scoring._iter_testcases", wraps=scoring._iter_testcases
+            ) as iter_testcases,
+        ):
+            collect_scores_combined(
+                "0a", langgraph_dir, data_dir=data_dir, project_root=root
+            )
+
+        assert iter_testcases.call_count == 1
+
+    def test_reverts_all_patches_in_reverse_order(
+        self, combined_dirs: tuple[Path, Path, Path]
+    ) -> None:
+        langgraph_dir, data_dir, root = combined_dirs
+        revert_calls: list[list[str]] = []
+
+        def fake_run(args: list[str], **kwargs: object) -> MagicMock:
+            result = MagicMock()
+            result.returncode = 0
+            if args[:2] == ["git", "apply"] and "--reverse" in args:
+                revert_calls.append(args)
+            return result
+
+        with patch("ate_features.scoring.subprocess.run", side_effect=fake_run):
+            collect_scores_combined(
+                "0a", langgraph_dir, data_dir=data_dir, project_root=root
+            )
+
+        assert len(revert_calls) == 1
+        reverted = [Path(a).stem for a in revert_calls[0][3:]]
+        assert reverted == ["F2", "F1"]
+
+    def test_conflicting_patches_fall_back_to_isolated(
+        self, combined_dirs: tuple[Path, Path, Path]
+    ) -> None:
+        langgraph_dir, data_dir, root = combined_dirs
+        git_calls: list[list[str]] = []
+        pytest_calls: list[list[str]] = []
+
+        def fake_run(args: list[str], **kwargs: object) -> MagicMock:
+            result = MagicMock()
+            result.returncode = 0
+            if args[0] == "git":
+                git_calls.append(args[1:])
+                # F1 is written, then F2 conflicts with it: the set-wide apply
+                # fails partway, so reverse-applying both fails as well
+                if args[1] == "apply" and len(args) > 3:
+                    result.returncode = 1
+            if args[1:3] == ["-m", "pytest"]:
+                pytest_calls.append(args)
+                for arg in args:
+                    if arg.startswith("--junitxml="):
+                        xml_path = Path(arg.split("=", 1)[1])
+                        xml_path.parent.mkdir(parents=True, exist_ok=True)
+                        xml_path.write_text(SAMPLE_XML)
+                        break
+            return result
+
+        with patch("ate_features.scoring.subprocess.run", side_effect=fake_run):
+            scores = collect_scores(
+                "0a", langgraph_dir,
+                data_dir=data_dir, project_root=root, mode="combined",
+            )
+
+        patches = [str(p) for p in sorted((data_dir / "patches" / "treatment-0a").iterdir())]
+        assert git_calls[:4] == [
+            ["apply", *patches],
+            ["apply", "--reverse", *reversed(patches)],
+            ["checkout", "."],
+            ["clean", "-fd"],
+        ]
+        # Then one pytest run per feature, as in isolated mode
+        assert len(pytest_calls) == 2
+        assert {s.feature_id for s in scores} == {"F1", "F2"}
+
+    def test_collection_error_falls_back_to_isolated(
+        self, combined_dirs: tuple[Path, Path, Path]
+    ) -> None:
+        langgraph_dir, data_dir, root = combined_dirs
+        pytest_calls: list[list[str]] = []
+
+        def fake_run(args: list[str], **kwargs: object) -> MagicMock:
+            result = MagicMock()
+            result.returncode = 0
+            if args[1:3] == ["-m", "pytest"]:
+                pytest_calls.append(args)
+                # The combined run hits an import error in one module
+                xml = COLLECTION_ERROR_XML if len(pytest_calls) == 1 else SAMPLE_XML
+                for arg in args:
+                    if arg.startswith("--junitxml="):
+                        xml_path = Path(arg.split("=", 1)[1])
+                        xml_path.parent.mkdir(parents=True, exist_ok=True)
+                        xml_path.write_text(xml)
+                        break
+            return result
+
+        with patch("ate_features.scoring.subprocess.run", side_effect=fake_run):
+            scores = collect_scores_combined(
+                "0a", langgraph_dir, data_dir=data_dir, project_root=root
+            )
+
+        # One combined run, then one isolated run per feature
+        assert len(pytest_calls) == 3
+        assert {s.feature_id for s in scores} == {"F1", "F2"}
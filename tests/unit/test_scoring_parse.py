@@ -5,6 +5,7 @@ from pathlib import Path
 import pytest
 
 from ate_features.scoring import (
+    _classify_tier,
     _extract_feature_id,
     parse_junit_xml,
     parse_junit_xml_cumulative,
@@ -144,6 +145,26 @@ class TestParseJunitXml:
         assert score.t1_passed == 0
         assert score.t1_total == 1
 
+    def test_skipped_not_counted_as_passed(self, tmp_path: Path) -> None:
+        xml = """\
+<?xml version="1.0" encoding="utf-8"?>
+<testsuites>
+  <testsuite name="pytest" tests="2" skipped="1">
+    <testcase classname="test.TestT1Basic" name="a">
+      <skipped type="pytest.skip" message="LangGraph not installed"/>
+    </testcase>
+    <testcase classname="test.TestT1Basic" name="b">
+      <system-out>ok</system-out>
+    </testcase>
+  </testsuite>
+</testsuites>
+"""
+        path = tmp_path / "skipped.xml"
+        path.write_text(xml)
+        score = parse_junit_xml(path, "F5", "0a")
+        assert score.t1_passed == 1
+        assert score.t1_total == 2
+
     def test_unknown_tier_ignored(self, tmp_path: Path) -> None:
         xml = """\
 <?xml version="1.0" encoding="utf-8"?>
@@ -186,6 +207,22 @@ COMBINED_XML = """\
 """
 
 
+class TestClassifyTier:
+    def test_each_tier(self) -> None:
+        base = "tests.acceptance.test_f1_pandas_serde."
+        assert _classify_tier(base + "TestT1Basic") == 0
+        assert _classify_tier(base + "TestT2EdgeCases") == 1
+        assert _classify_tier(base + "TestT3Quality") == 2
+        assert _classify_tier(base + "TestT4Smoke") == 3
+
+    def test_unknown_class(self) -> None:
+        assert _classify_tier("tests.unit.test_config.TestFoo") is None
+
+    def test_marker_without_tier_digit(self) -> None:
+        assert _classify_tier("test.TestT") is None
+        assert _classify_tier("test.TestT9Extra") is None
+
+
 class TestExtractFeatureId:
     def test_extracts_from_classname(self) -> None:
         assert _extract_feature_id(
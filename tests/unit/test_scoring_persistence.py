@@ -1,6 +1,7 @@
 """Tests for score persistence (save/load)."""
 
 import json
+import os
 from pathlib import Path
 
 from ate_features.models import TieredScore
@@ -48,6 +49,20 @@ class TestSaveScores:
         data = json.loads(path.read_text())
         assert len(data) == 2
 
+    def test_format_matches_stdlib_json(self, tmp_path: Path) -> None:
+        scores = [_make_score("F1", "0a"), _make_score("F2", "0a")]
+        path = save_scores(scores, "0a", data_dir=tmp_path)
+        # Holds for score data (strings and ints) only, not arbitrary floats
+        expected = json.dumps([s.model_dump(mode="json") for s in scores], indent=2)
+        assert path.read_text() == expected
+
+    def test_skips_write_when_unchanged(self, tmp_path: Path) -> None:
+        scores = [_make_score("F1", "0a")]
+        path = save_scores(scores, "0a", data_dir=tmp_path)
+        os.utime(path, ns=(0, 0))
+        save_scores(scores, "0a", data_dir=tmp_path)
+        assert path.stat().st_mtime_ns == 0
+
 
 class TestLoadScores:
     def test_round_trip(self, tmp_path: Path) -> None:
@@ -107,3 +122,16 @@ class TestLoadAllScores:
         save_scores([_make_score("F1", "0a")], "0a", data_dir=tmp_path)
         all_scores = load_all_scores(data_dir=tmp_path)
         assert len(all_scores) == 1
+
+    def test_sorted_by_treatment_and_skips_directories(self, tmp_path: Path) -> None:
+        save_scores([_make_score("F1", "0b")], "0b", data_dir=tmp_path)
+        save_scores([_make_score("F1", "0a")], "0a", data_dir=tmp_path)
+        (tmp_path / "scores" / "treatment-tmp.json").mkdir()
+        all_scores = load_all_scores(data_dir=tmp_path)
+        assert list(all_scores) == ["0a", "0b"]
+
+    def test_ignores_file_with_empty_treatment_id(self, tmp_path: Path) -> None:
+        save_scores([_make_score("F1", "0a")], "0a", data_dir=tmp_path)
+        (tmp_path / "scores" / "treatment-.json").write_text("[]")
+        all_scores = load_all_scores(data_dir=tmp_path)
+        assert list(all_scores) == ["0a"]